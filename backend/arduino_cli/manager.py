@@ -1,16 +1,50 @@
+import asyncio
 import subprocess
-import json
-import os
-from typing import List, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 
-class ArduinoManager:
-    """Wrapper for Arduino CLI operations"""
-    
-    def __init__(self, cli_path: Optional[str] = None):
-        self.cli_path = cli_path or os.getenv('ARDUINO_CLI_PATH', 'arduino-cli')
-        self._verify_cli()
-    
+# The CLI wrapper implementation is shared with the desktop app through
+# the arduino_common package (packages/arduino_common)
+from arduino_common import BaseArduinoCLI, FallbackQuery, BUILD_TIMEOUT, SPAWN_KWARGS
+
+
+async def _reap(proc: asyncio.subprocess.Process):
+    """Kill proc if it is still running and wait for it to exit"""
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+class ArduinoManager(BaseArduinoCLI):
+    """Wrapper for Arduino CLI operations
+
+    All CLI calls are coroutines so they can be awaited from FastAPI
+    handlers without blocking the event loop. Failed queries raise
+    subprocess.CalledProcessError.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, cli_path: Optional[str] = None, verify: bool = True):
+        super().__init__(cli_path)
+        if verify:
+            self._verify_cli()
+
+    @classmethod
+    async def create(cls, cli_path: Optional[str] = None) -> 'ArduinoManager':
+        """Create a manager and verify the CLI without blocking the event loop"""
+        manager = cls(cli_path, verify=False)
+        try:
+            version = await manager.version()
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            raise RuntimeError(f"Arduino CLI not found or not working: {e}")
+        print(f"Arduino CLI version: {version}")
+        manager.available = True
+        return manager
+
     def _verify_cli(self):
         """Verify Arduino CLI is installed and accessible"""
         try:
@@ -18,98 +52,116 @@ class ArduinoManager:
                 [self.cli_path, 'version'],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                **SPAWN_KWARGS
             )
             print(f"Arduino CLI version: {result.stdout.strip()}")
+            self.available = True
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             raise RuntimeError(f"Arduino CLI not found or not working: {e}")
-    
-    def list_boards(self) -> List[Dict]:
-        """List all available board types"""
-        result = subprocess.run(
-            [self.cli_path, 'board', 'listall', '--format', 'json'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return json.loads(result.stdout).get('boards', [])
-    
-    def list_connected_boards(self) -> List[Dict]:
-        """List connected Arduino/ESP32 boards"""
-        result = subprocess.run(
-            [self.cli_path, 'board', 'list', '--format', 'json'],
-            capture_output=True,
-            text=True,
-            check=True
+
+    async def _run(self, args: Sequence[str], timeout: float) -> bytes:
+        """Run an Arduino CLI command and return its raw stdout
+
+        Raises:
+            subprocess.CalledProcessError: if the command exits non-zero
+            subprocess.TimeoutExpired: if it runs longer than timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            self.cli_path, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **SPAWN_KWARGS
         )
-        return json.loads(result.stdout)
-    
-    def compile_sketch(self, sketch_path: str, fqbn: str) -> Dict:
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired([self.cli_path, *args], timeout)
+        finally:
+            # Also covers cancellation, e.g. a client disconnecting mid-build
+            await _reap(proc)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, [self.cli_path, *args],
+                output=stdout, stderr=stderr
+            )
+        return stdout
+
+    async def _query(self, args: Sequence[str], parse: Callable[[bytes], Any],
+                     timeout: float, default: Any = None, cache_key: Optional[Tuple] = None):
+        if cache_key is not None:
+            hit, value = self._cache_get(cache_key)
+            if hit:
+                return value
+        try:
+            value = parse(await self._run(args, timeout))
+        except FallbackQuery as fallback:
+            value = fallback.parse(await self._run(fallback.command, timeout))
+        if cache_key is not None:
+            self._cache_put(cache_key, value)
+        return value
+
+    async def _action(self, args: Sequence[str], timeout: float,
+                      output_dir: Optional[Path] = None, clears_cache: bool = False) -> Dict:
+        try:
+            stdout = await self._run(args, timeout)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            return self._failure(e)
+        if clears_cache:
+            self.clear_cache()
+        return self._success(stdout, output_dir)
+
+    async def compile_sketch(self, sketch_path: str, fqbn: str,
+                             output_dir: Optional[Path] = None,
+                             progress_cb: Optional[Callable[[str], Awaitable[None]]] = None) -> Dict:
         """Compile an Arduino sketch
-        
+
         Args:
             sketch_path: Path to sketch directory or .ino file
             fqbn: Fully Qualified Board Name (e.g., 'arduino:avr:uno')
+            output_dir: Directory for the build artifacts (see
+                BaseArduinoCLI.compile_sketch)
+            progress_cb: Coroutine called with each line of build output as
+                it is produced, e.g. ``websocket.send_text``. The log is
+                streamed instead of buffered, so 'output' is empty.
         """
-        try:
-            result = subprocess.run(
-                [self.cli_path, 'compile', '--fqbn', fqbn, sketch_path, '--format', 'json'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return {'success': True, 'output': result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {'success': False, 'error': e.stderr}
-    
-    def upload_sketch(self, sketch_path: str, fqbn: str, port: str) -> Dict:
-        """Upload compiled sketch to board
-        
-        Args:
-            sketch_path: Path to sketch directory
-            fqbn: Fully Qualified Board Name
-            port: Serial port (e.g., '/dev/ttyUSB0' or 'COM3')
-        """
-        try:
-            result = subprocess.run(
-                [self.cli_path, 'upload', '--fqbn', fqbn, '--port', port, sketch_path],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return {'success': True, 'output': result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {'success': False, 'error': e.stderr}
-    
-    def install_library(self, library_name: str) -> Dict:
-        """Install an Arduino library"""
-        try:
-            result = subprocess.run(
-                [self.cli_path, 'lib', 'install', library_name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return {'success': True, 'output': result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {'success': False, 'error': e.stderr}
-    
-    def list_libraries(self) -> List[Dict]:
-        """List installed libraries"""
-        result = subprocess.run(
-            [self.cli_path, 'lib', 'list', '--format', 'json'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return json.loads(result.stdout).get('installed_libraries', [])
-    
-    def search_libraries(self, query: str) -> List[Dict]:
-        """Search for libraries in Arduino Library Manager"""
-        result = subprocess.run(
-            [self.cli_path, 'lib', 'search', query, '--format', 'json'],
-            capture_output=True,
-            text=True,
-            check=True
+        if progress_cb is None:
+            return await super().compile_sketch(sketch_path, fqbn, output_dir)
+        args = self._compile_args(sketch_path, fqbn, output_dir, json_report=False)
+        return await self._stream(args, BUILD_TIMEOUT, progress_cb, output_dir)
+
+    async def _stream(self, args: Sequence[str], timeout: float,
+                      progress_cb: Callable[[str], Awaitable[None]],
+                      output_dir: Optional[Path] = None) -> Dict:
+        """Run a command, forwarding each stdout line to progress_cb as it arrives"""
+        proc = await asyncio.create_subprocess_exec(
+            self.cli_path, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **SPAWN_KWARGS
         )
-        return json.loads(result.stdout).get('libraries', [])
+        # Drain stderr concurrently so a chatty build cannot fill its pipe
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+        async def pump() -> int:
+            async for line in proc.stdout:
+                await progress_cb(line.decode(errors='replace'))
+            return await proc.wait()
+
+        try:
+            returncode = await asyncio.wait_for(pump(), timeout)
+            stderr = await stderr_task
+        except asyncio.TimeoutError:
+            return self._failure(subprocess.TimeoutExpired([self.cli_path, *args], timeout))
+        finally:
+            # Also runs when progress_cb raises (e.g. the websocket closed)
+            # or the caller is cancelled, so the build never outlives it
+            await _reap(proc)
+            if not stderr_task.done():
+                stderr_task.cancel()
+                await asyncio.gather(stderr_task, return_exceptions=True)
+        if returncode != 0:
+            return self._failure(subprocess.CalledProcessError(
+                returncode, [self.cli_path, *args], stderr=stderr
+            ))
+        return self._success(b'', output_dir)
@@ -1,8 +1,12 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse, Response
 from contextlib import asynccontextmanager
+import asyncio
 import os
+import re
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,12 +14,34 @@ load_dotenv()
 # Import routers
 from api import boards, upload, compile, libraries, projects, ports
 from websocket import simulation, serial_monitor
+from arduino_cli import ArduinoManager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Arduino Simulation Platform starting...")
     # Initialize database, check Arduino CLI, etc.
+    # The CLI probes are independent, so run them concurrently; the board
+    # and library listings also warm the manager's cache for first requests.
+    arduino = ArduinoManager(verify=False)
+    version, boards, libraries = await asyncio.gather(
+        arduino.version(),
+        arduino.list_boards(),
+        arduino.list_libraries(),
+        return_exceptions=True
+    )
+    if isinstance(version, BaseException):
+        print(f"⚠️ Arduino CLI not found or not working: {version}")
+        app.state.arduino = None
+        app.state.arduino_version = None
+    else:
+        print(f"Arduino CLI version: {version}")
+        # Verified, as ArduinoManager.create() would mark it
+        arduino.available = True
+        app.state.arduino = arduino
+        app.state.arduino_version = version
+    app.state.boards = [] if isinstance(boards, BaseException) else boards
+    app.state.libraries = [] if isinstance(libraries, BaseException) else libraries
     yield
     # Shutdown
     print("👋 Shutting down...")
@@ -24,13 +50,35 @@ app = FastAPI(
     title="Arduino Simulation Platform API",
     description="Backend API for Arduino & ESP32 circuit simulation and programming",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
+# Origins are parsed once at startup: literal entries are matched by set
+# lookup (a bare "*" keeps Starlette's allow-all behaviour), and entries
+# containing "*" (e.g. "https://*.example.com") are folded into a single
+# regex pattern.
+CORS_ORIGINS = frozenset(
+    o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",") if o.strip()
+)
+CORS_LITERAL_ORIGINS = frozenset(o for o in CORS_ORIGINS if o == "*" or "*" not in o)
+CORS_WILDCARD_ORIGINS = sorted(CORS_ORIGINS - CORS_LITERAL_ORIGINS)
+# "*" stands for one or more host labels, so it cannot reach into a query,
+# userinfo or port part. Starlette compiles the pattern itself.
+CORS_WILDCARD_PATTERN = r"[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*"
+CORS_ORIGIN_REGEX = (
+    "^(" + "|".join(
+        re.escape(o).replace(r"\*", CORS_WILDCARD_PATTERN) for o in CORS_WILDCARD_ORIGINS
+    ) + ")$"
+) if CORS_WILDCARD_ORIGINS else None
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=os.getenv("CORS_ORIGINS", "http://localhost:3000").split(","),
+    # Passed as the set itself: Starlette keeps the collection it is given
+    # and tests membership with "in"
+    allow_origins=CORS_LITERAL_ORIGINS,
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -53,17 +101,21 @@ async def websocket_simulation(websocket: WebSocket):
 async def websocket_serial(websocket: WebSocket):
     await serial_monitor.handle_serial(websocket)
 
-@app.get("/")
+# Static payloads are serialized once at import
+ROOT_BODY = ORJSONResponse(content={
+    "message": "Arduino Simulation Platform API",
+    "version": "1.0.0",
+    "docs": "/docs"
+}).body
+HEALTH_BODY = ORJSONResponse(content={"status": "healthy", "service": "arduino-sim-api"}).body
+
+@app.get("/", response_model=None)
 async def root():
-    return {
-        "message": "Arduino Simulation Platform API",
-        "version": "1.0.0",
-        "docs": "/docs"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
-@app.get("/health")
+@app.get("/health", response_model=None)
 async def health_check():
-    return {"status": "healthy", "service": "arduino-sim-api"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -71,5 +123,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", 8000)),
-        reload=True
+        reload=True,
+        # uvicorn[standard] ships uvloop everywhere except Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
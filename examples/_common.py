@@ -0,0 +1,72 @@
+"""
+Shared helpers for the example scripts
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.models.component import Component, Connection
+from src.ui.canvas_view import WireGraphicsItem
+
+
+def led_operating_point(v_supply, v_forward, resistance, max_current):
+    """Expected LED current and brightness for a supply driving a series resistor + LED
+
+    Ideal-diode estimate for the example printouts: a reverse-biased or
+    under-driven LED carries no current. Accepts scalars or NumPy arrays
+    and evaluates elementwise.
+
+    Returns:
+        (current, brightness) where brightness is current as a fraction of
+        max_current, capped at 1.0
+    """
+    current = np.maximum((np.asarray(v_supply, dtype=float) - v_forward) / resistance, 0.0)
+    brightness = np.minimum(1.0, current / max_current)
+    return current, brightness
+
+
+def get_components_by_type(canvas) -> Dict[str, Component]:
+    """Map component type to component in a single pass over the circuit
+
+    The examples place one component of each type, so the last component
+    seen for a type wins.
+    """
+    return {c.type: c for c in canvas.circuit.components.values()}
+
+
+def add_wires(canvas, wires: List) -> None:
+    """Add fully constructed wire items to the canvas scene in one batch"""
+    add_item = canvas.scene.addItem
+    for wire in wires:
+        add_item(wire)
+    canvas.wire_items.update((wire.connection.id, wire) for wire in wires)
+
+
+def pin_scene_positions(canvas, connections: Iterable[Connection]) -> Dict[Tuple[str, str], object]:
+    """Map each (component_id, pin_name) used by connections to its scene position
+
+    Every pin is mapped to scene coordinates once, however many wires
+    share it.
+    """
+    items = canvas.component_items
+    positions = {}
+    for conn in connections:
+        for key in ((conn.from_component, conn.from_pin), (conn.to_component, conn.to_pin)):
+            if key not in positions:
+                item = items[key[0]]
+                positions[key] = item.mapToScene(item.pin_items[key[1]].pos())
+    return positions
+
+
+def create_wires(canvas, connections: List[Connection]) -> List:
+    """Build a wire graphics item for each connection"""
+    positions = pin_scene_positions(canvas, connections)
+    return [
+        WireGraphicsItem(
+            conn,
+            positions[(conn.from_component, conn.from_pin)],
+            positions[(conn.to_component, conn.to_pin)]
+        )
+        for conn in connections
+    ]
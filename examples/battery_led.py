@@ -12,8 +12,9 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.ui.qt_compat import QApplication, QPointF, QTimer, exec_app
-from src.ui.canvas_view import CanvasView, WireGraphicsItem
+from src.ui.canvas_view import CanvasView
 from src.models.component import Connection
+from _common import get_components_by_type, create_wires, add_wires, led_operating_point
 
 
 def create_battery_led_circuit(canvas: CanvasView):
@@ -30,10 +31,8 @@ def create_battery_led_circuit(canvas: CanvasView):
     canvas.add_component('led', QPointF(200, 0))
     
     # Get component references
-    components = list(canvas.circuit.components.values())
-    battery = next(c for c in components if c.type == 'battery')
-    resistor = next(c for c in components if c.type == 'resistor')
-    led = next(c for c in components if c.type == 'led')
+    by_type = get_components_by_type(canvas)
+    battery, resistor, led = by_type['battery'], by_type['resistor'], by_type['led']
     
     print(f"Battery ID: {battery.id}")
     print(f"Resistor ID: {resistor.id}")
@@ -68,30 +67,7 @@ def create_battery_led_circuit(canvas: CanvasView):
     print(f"Connected: LED(cathode) -> Battery(-)")
     
     # Create wire graphics items
-    battery_item = canvas.component_items[battery.id]
-    resistor_item = canvas.component_items[resistor.id]
-    led_item = canvas.component_items[led.id]
-    
-    # Wire 1: Battery to Resistor
-    start_pos1 = battery_item.mapToScene(battery_item.pin_items['positive'].pos())
-    end_pos1 = resistor_item.mapToScene(resistor_item.pin_items['pin1'].pos())
-    wire1 = WireGraphicsItem(connection1, start_pos1, end_pos1)
-    canvas.scene.addItem(wire1)
-    canvas.wire_items.append(wire1)
-    
-    # Wire 2: Resistor to LED
-    start_pos2 = resistor_item.mapToScene(resistor_item.pin_items['pin2'].pos())
-    end_pos2 = led_item.mapToScene(led_item.pin_items['anode'].pos())
-    wire2 = WireGraphicsItem(connection2, start_pos2, end_pos2)
-    canvas.scene.addItem(wire2)
-    canvas.wire_items.append(wire2)
-    
-    # Wire 3: LED to Battery
-    start_pos3 = led_item.mapToScene(led_item.pin_items['cathode'].pos())
-    end_pos3 = battery_item.mapToScene(battery_item.pin_items['negative'].pos())
-    wire3 = WireGraphicsItem(connection3, start_pos3, end_pos3)
-    canvas.scene.addItem(wire3)
-    canvas.wire_items.append(wire3)
+    add_wires(canvas, create_wires(canvas, [connection1, connection2, connection3]))
     
     print("\nCircuit created successfully!")
     print(f"Components: {len(canvas.circuit.components)}")
@@ -107,10 +83,15 @@ def create_battery_led_circuit(canvas: CanvasView):
     print(f"LED max current: {led.properties['max_current']*1000}mA")
     print("\nCalculated values:")
     voltage_drop = battery.properties['voltage'] - led.properties['forward_voltage']
-    current = voltage_drop / resistor.properties['resistance']
+    current, brightness = led_operating_point(
+        battery.properties['voltage'],
+        led.properties['forward_voltage'],
+        resistor.properties['resistance'],
+        led.properties['max_current']
+    )
     print(f"Voltage across resistor: {voltage_drop}V")
     print(f"Current through circuit: {current*1000:.2f}mA")
-    print(f"\nLED should light up with brightness: {min(1.0, current/led.properties['max_current'])*100:.0f}%")
+    print(f"\nLED should light up with brightness: {brightness*100:.0f}%")
     print("="*60)
 
 
@@ -12,8 +12,9 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.ui.qt_compat import QApplication, QPointF, QTimer, exec_app
-from src.ui.canvas_view import CanvasView, WireGraphicsItem
+from src.ui.canvas_view import CanvasView
 from src.models.component import Connection
+from _common import get_components_by_type, create_wires, add_wires
 
 
 def create_test_circuit(canvas: CanvasView):
@@ -29,10 +30,8 @@ def create_test_circuit(canvas: CanvasView):
     canvas.add_component('resistor', QPointF(0, 0))
     canvas.add_component('led', QPointF(200, 0))
     
-    components = list(canvas.circuit.components.values())
-    battery = next(c for c in components if c.type == 'battery')
-    resistor = next(c for c in components if c.type == 'resistor')
-    led = next(c for c in components if c.type == 'led')
+    by_type = get_components_by_type(canvas)
+    battery, resistor, led = by_type['battery'], by_type['resistor'], by_type['led']
     
     print(f"\nAdded components:")
     print(f"  1. Battery: ID={battery.id[:8]}...")
@@ -69,31 +68,8 @@ def create_test_circuit(canvas: CanvasView):
     canvas.circuit.add_connection(connection3)
     print(f"  ✓ LED(cathode) -> Battery(-) [ID: {connection3.id[:8]}...]")
     
-    # Create wire graphics
-    battery_item = canvas.component_items[battery.id]
-    resistor_item = canvas.component_items[resistor.id]
-    led_item = canvas.component_items[led.id]
-    
-    # Wire 1
-    start_pos1 = battery_item.mapToScene(battery_item.pin_items['positive'].pos())
-    end_pos1 = resistor_item.mapToScene(resistor_item.pin_items['pin1'].pos())
-    wire1 = WireGraphicsItem(connection1, start_pos1, end_pos1)
-    canvas.scene.addItem(wire1)
-    canvas.wire_items.append(wire1)
-    
-    # Wire 2
-    start_pos2 = resistor_item.mapToScene(resistor_item.pin_items['pin2'].pos())
-    end_pos2 = led_item.mapToScene(led_item.pin_items['anode'].pos())
-    wire2 = WireGraphicsItem(connection2, start_pos2, end_pos2)
-    canvas.scene.addItem(wire2)
-    canvas.wire_items.append(wire2)
-    
-    # Wire 3
-    start_pos3 = led_item.mapToScene(led_item.pin_items['cathode'].pos())
-    end_pos3 = battery_item.mapToScene(battery_item.pin_items['negative'].pos())
-    wire3 = WireGraphicsItem(connection3, start_pos3, end_pos3)
-    canvas.scene.addItem(wire3)
-    canvas.wire_items.append(wire3)
+    # Create wire graphics items
+    add_wires(canvas, create_wires(canvas, [connection1, connection2, connection3]))
     
     print(f"\n✓ Circuit created with {len(canvas.circuit.components)} components")
     print(f"✓ Total connections: {len(canvas.circuit.connections)}")
@@ -145,16 +121,22 @@ def show_nodes(canvas: CanvasView):
     canvas.stop_simulation()
     
     if hasattr(canvas.simulation_engine, 'nodes'):
+        # Collect the report and write it once rather than printing per pin
+        lines = []
+        append = lines.append
+        get_component = canvas.circuit.get_component
         for node_id, pins in canvas.simulation_engine.nodes.items():
             voltage = canvas.simulation_engine.node_voltages.get(node_id, 0.0)
-            print(f"Node '{node_id}' @ {voltage:.2f}V:")
+            append(f"Node '{node_id}' @ {voltage:.2f}V:")
             for comp_id, pin_name in pins:
-                comp = canvas.circuit.get_component(comp_id)
+                comp = get_component(comp_id)
                 if comp:
                     pin = comp.get_pin(pin_name)
                     if pin:
-                        print(f"  - {comp.name}.{pin_name}: "
-                              f"V={pin.voltage:.2f}V, I={pin.current*1000:.2f}mA")
+                        append(f"  - {comp.name}.{pin_name}: "
+                               f"V={pin.voltage:.2f}V, I={pin.current*1000:.2f}mA")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n" + "="*60)
     print("\nKEYBOARD SHORTCUTS:")
@@ -19,6 +19,7 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QSettings
 from PyQt6.QtGui import QIcon
 from src.ui.main_window import MainWindow
+from src.ui.theme import apply_dark_theme
 from src.utils.logger import setup_logger
 
 
@@ -70,66 +71,5 @@ def main():
         sys.exit(1)
 
 
-def apply_dark_theme(app: QApplication):
-    """Apply dark theme to application"""
-    dark_stylesheet = """
-    QMainWindow, QDialog, QWidget {
-        background-color: #2b2b2b;
-        color: #ffffff;
-    }
-    QMenuBar {
-        background-color: #3c3c3c;
-        color: #ffffff;
-    }
-    QMenuBar::item:selected {
-        background-color: #4a4a4a;
-    }
-    QMenu {
-        background-color: #3c3c3c;
-        color: #ffffff;
-    }
-    QMenu::item:selected {
-        background-color: #4a4a4a;
-    }
-    QToolBar {
-        background-color: #3c3c3c;
-        border: none;
-    }
-    QPushButton {
-        background-color: #4a4a4a;
-        color: #ffffff;
-        border: 1px solid #5a5a5a;
-        padding: 5px 10px;
-        border-radius: 3px;
-    }
-    QPushButton:hover {
-        background-color: #5a5a5a;
-    }
-    QPushButton:pressed {
-        background-color: #3a3a3a;
-    }
-    QTextEdit, QPlainTextEdit, QLineEdit {
-        background-color: #1e1e1e;
-        color: #d4d4d4;
-        border: 1px solid #3c3c3c;
-    }
-    QTabWidget::pane {
-        border: 1px solid #3c3c3c;
-        background-color: #2b2b2b;
-    }
-    QTabBar::tab {
-        background-color: #3c3c3c;
-        color: #ffffff;
-        padding: 8px 12px;
-        border: 1px solid #3c3c3c;
-    }
-    QTabBar::tab:selected {
-        background-color: #2b2b2b;
-        border-bottom: 2px solid #007acc;
-    }
-    """
-    app.setStyleSheet(dark_stylesheet)
-
-
 if __name__ == '__main__':
     main()
@@ -0,0 +1,8 @@
+"""
+Arduino CLI core shared by the desktop app (src/arduino) and the backend
+(backend/arduino_cli)
+"""
+
+from .cli_base import BaseArduinoCLI, FallbackQuery, BUILD_TIMEOUT, QUERY_TIMEOUT, SPAWN_KWARGS
+
+__all__ = ['BaseArduinoCLI', 'FallbackQuery', 'BUILD_TIMEOUT', 'QUERY_TIMEOUT', 'SPAWN_KWARGS']
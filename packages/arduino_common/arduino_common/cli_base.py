@@ -0,0 +1,252 @@
+"""
+Arduino CLI shared implementation
+Command lines, output parsing and result caching shared by the desktop
+ArduinoCLI wrapper and the backend ArduinoManager
+"""
+
+import os
+import re
+from abc import ABC, abstractmethod
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Board and library indices change on the order of hours
+CACHE_TTL = 300.0
+CACHE_MAXSIZE = 64
+
+# Timeouts in seconds
+QUERY_TIMEOUT = 10
+BUILD_TIMEOUT = 60
+
+# subprocess only uses posix_spawn (no fork, so no copying of the parent's
+# page tables) when the executable path has a directory part and
+# close_fds is False (bpo-35823). cli_path is resolved to an absolute
+# path, and descriptors are non-inheritable by default (PEP 446), so
+# leaving them open is safe. Windows has no fork, so keep its defaults.
+SPAWN_KWARGS = {} if os.name == 'nt' else {'close_fds': False}
+
+
+# Parts of the compile --format json report kept when artifacts are
+# written to an output directory
+_REPORT_SUMMARY_KEYS = ('success', 'builder_result')
+
+_LIBRARY_HEADER = re.compile(r'(Name\s+)(Installed\s+)')
+
+_LIBRARY_JSON_ARGS = ('lib', 'list', '--format', 'json')
+
+
+def _text(stdout: bytes) -> str:
+    return stdout.decode().strip()
+
+
+def _json_key(key: str) -> Callable[[bytes], Any]:
+    return lambda stdout: json_loads(stdout).get(key, [])
+
+
+class FallbackQuery(Exception):
+    """Raised by a parser that does not recognise the output format
+
+    _query() implementations rerun the query as ``args`` and parse the
+    result with ``parse`` instead.
+    """
+
+    def __init__(self, args: Sequence[str], parse: Callable[[bytes], Any]):
+        super().__init__(' '.join(args))
+        self.command = tuple(args)
+        self.parse = parse
+
+
+def _library_table(stdout: bytes) -> List[Dict[str, Dict[str, str]]]:
+    """Parse the name and installed version out of ``lib list`` text output
+
+    Library names may contain spaces, so rows are sliced at the column
+    offsets given by the header line rather than split on whitespace.
+    Entries keep the shape of the JSON listing, reduced to
+    ``{'library': {'name': ..., 'version': ...}}``. An unrecognised
+    header (e.g. a translated one) falls back to the JSON listing.
+    """
+    lines = stdout.decode(errors='replace').splitlines()
+    if not lines:
+        return []
+    header = _LIBRARY_HEADER.match(lines[0])
+    if header is None:
+        raise FallbackQuery(_LIBRARY_JSON_ARGS, _json_key('installed_libraries'))
+    name_end, version_end = header.start(2), header.end(2)
+    libraries = []
+    for line in lines[1:]:
+        name = line[:name_end].strip()
+        if name:
+            version = line[name_end:version_end].strip()
+            libraries.append({'library': {'name': name, 'version': version}})
+    return libraries
+
+
+class BaseArduinoCLI(ABC):
+    """Shared implementation of the Arduino CLI wrappers
+
+    Each public method describes one arduino-cli invocation and hands it
+    to ``_query`` (commands whose JSON output is parsed and returned) or
+    ``_action`` (commands returning a success/error dict). Subclasses
+    implement those two hooks, synchronously for the desktop app or as
+    coroutines for the backend, so the public methods return either a
+    value or an awaitable accordingly.
+    """
+
+    __slots__ = ('cli_path', 'available', '_cache')
+
+    def __init__(self, cli_path: Optional[str] = None):
+        cli_path = cli_path or os.getenv('ARDUINO_CLI_PATH', 'arduino-cli')
+        # Resolve against PATH once so each call execs an absolute path
+        self.cli_path = shutil.which(cli_path) or cli_path
+        self.available = False
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+    @abstractmethod
+    def _query(self, args: Sequence[str], parse: Callable[[bytes], Any],
+               timeout: float, default: Any = None, cache_key: Optional[Tuple] = None):
+        """Run a read-only command and return its parsed output"""
+
+    @abstractmethod
+    def _action(self, args: Sequence[str], timeout: float,
+                output_dir: Optional[Path] = None, clears_cache: bool = False):
+        """Run a command and return a {'success': ..., 'output'/'error': ...} dict"""
+
+    def _cache_get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return (hit, value) for key, treating entries older than CACHE_TTL as misses"""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < CACHE_TTL:
+            return True, entry[1]
+        return False, None
+
+    def _cache_put(self, key: Tuple, value: Any):
+        """Store value for key, evicting the oldest entry when full"""
+        if key not in self._cache and len(self._cache) >= CACHE_MAXSIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic(), value)
+
+    def clear_cache(self):
+        """Drop all cached board and library listings"""
+        self._cache.clear()
+
+    @staticmethod
+    def _success(stdout: bytes, output_dir: Optional[Path] = None) -> Dict:
+        if output_dir is None:
+            return {'success': True, 'output': stdout.decode()}
+        # The artifacts are served as files, so of the JSON build report
+        # (which also carries the full compiler output) only the summary
+        # is kept
+        report = json_loads(stdout) if stdout.strip() else {}
+        return {
+            'success': True,
+            'output': {key: report[key] for key in _REPORT_SUMMARY_KEYS if key in report},
+            'artifacts': sorted(
+                str(path) for path in Path(output_dir).iterdir() if path.is_file()
+            ),
+        }
+
+    @staticmethod
+    def _failure(error: Exception) -> Dict:
+        if isinstance(error, subprocess.CalledProcessError):
+            stderr = error.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode(errors='replace')
+            return {'success': False, 'error': stderr}
+        return {'success': False, 'error': str(error)}
+
+    def version(self):
+        """Return the Arduino CLI version string"""
+        return self._query(('version',), _text, QUERY_TIMEOUT, default='')
+
+    def list_boards(self):
+        """List all available board types"""
+        return self._query(
+            ('board', 'listall', '--format', 'json'), _json_key('boards'),
+            QUERY_TIMEOUT, default=[], cache_key=('list_boards',)
+        )
+
+    def list_connected_boards(self):
+        """List connected Arduino/ESP32 boards"""
+        return self._query(
+            ('board', 'list', '--format', 'json'), json_loads,
+            QUERY_TIMEOUT, default=[]
+        )
+
+    def compile_sketch(self, sketch_path: str, fqbn: str,
+                       output_dir: Optional[Path] = None):
+        """Compile an Arduino sketch
+
+        Args:
+            sketch_path: Path to sketch directory or .ino file
+            fqbn: Fully Qualified Board Name (e.g., 'arduino:avr:uno')
+            output_dir: Directory for the build artifacts (.hex/.bin/.elf).
+                When given, the artifact paths are returned under
+                'artifacts' so callers can serve them as files, and
+                'output' holds only the report's 'success' and
+                'builder_result' instead of the whole build log.
+        """
+        args = self._compile_args(sketch_path, fqbn, output_dir)
+        return self._action(args, BUILD_TIMEOUT, output_dir=output_dir)
+
+    @staticmethod
+    def _compile_args(sketch_path: str, fqbn: str, output_dir: Optional[Path] = None,
+                      json_report: bool = True) -> list:
+        # The JSON report is only printed once the build finishes, so
+        # callers that stream progress ask for the plain build log instead
+        args = ['compile', '--fqbn', fqbn, sketch_path, '--no-color']
+        if json_report:
+            args += ['--format', 'json']
+        if output_dir is not None:
+            args += ['--output-dir', str(output_dir)]
+        return args
+
+    def upload_sketch(self, sketch_path: str, fqbn: str, port: str):
+        """Upload compiled sketch to board
+
+        Args:
+            sketch_path: Path to sketch directory
+            fqbn: Fully Qualified Board Name
+            port: Serial port (e.g., '/dev/ttyUSB0' or 'COM3')
+        """
+        return self._action(
+            ('upload', '--fqbn', fqbn, '--port', port, sketch_path), BUILD_TIMEOUT
+        )
+
+    def install_library(self, library_name: str):
+        """Install an Arduino library"""
+        return self._action(('lib', 'install', library_name), BUILD_TIMEOUT, clears_cache=True)
+
+    def list_libraries(self):
+        """List the name and version of each installed library
+
+        Parsed from the plain table output, which is far smaller than the
+        JSON listing; use list_libraries_full() for library details.
+        Entries read the same as list_libraries_full() entries, e.g.
+        ``lib['library']['name']``.
+        """
+        return self._query(
+            ('lib', 'list', '--no-color'), _library_table,
+            QUERY_TIMEOUT, default=[], cache_key=('list_libraries',)
+        )
+
+    def list_libraries_full(self):
+        """List installed libraries with their full metadata"""
+        return self._query(
+            _LIBRARY_JSON_ARGS, _json_key('installed_libraries'),
+            QUERY_TIMEOUT, default=[], cache_key=('list_libraries_full',)
+        )
+
+    def search_libraries(self, query: str):
+        """Search for libraries in Arduino Library Manager"""
+        return self._query(
+            ('lib', 'search', query, '--format', 'json'), _json_key('libraries'),
+            QUERY_TIMEOUT, default=[], cache_key=('search_libraries', query)
+        )
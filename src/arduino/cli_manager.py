@@ -4,19 +4,25 @@ Wrapper for Arduino CLI operations
 """
 
 import subprocess
-import json
-import os
-from typing import List, Dict, Optional
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
+from arduino_common import BaseArduinoCLI, FallbackQuery, SPAWN_KWARGS
+
+
+class ArduinoCLI(BaseArduinoCLI):
+    """Wrapper for Arduino CLI operations
+
+    Hardware features are optional on the desktop: when the CLI is missing
+    or a command fails, queries return empty results instead of raising.
+    """
+
+    __slots__ = ()
 
-class ArduinoCLI:
-    """Wrapper for Arduino CLI operations"""
-    
     def __init__(self, cli_path: Optional[str] = None):
-        self.cli_path = cli_path or os.getenv('ARDUINO_CLI_PATH', 'arduino-cli')
+        super().__init__(cli_path)
         self.available = self._check_availability()
-        
+
     def _check_availability(self) -> bool:
         """Check if Arduino CLI is available"""
         try:
@@ -24,7 +30,8 @@ class ArduinoCLI:
                 [self.cli_path, 'version'],
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=5,
+                **SPAWN_KWARGS
             )
             if result.returncode == 0:
                 print(f"Arduino CLI found: {result.stdout.strip()}")
@@ -33,77 +40,48 @@ class ArduinoCLI:
             print("Arduino CLI not found - hardware features disabled")
             print("Install with: brew install arduino-cli")
         return False
-    
-    def list_boards(self) -> List[Dict]:
-        """List all available board types"""
-        if not self.available:
-            return []
-            
-        try:
-            result = subprocess.run(
-                [self.cli_path, 'board', 'listall', '--format', 'json'],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10
-            )
-            return json.loads(result.stdout).get('boards', [])
-        except Exception as e:
-            print(f"Error listing boards: {e}")
-            return []
-    
-    def list_connected_boards(self) -> List[Dict]:
-        """List connected Arduino/ESP32 boards"""
-        if not self.available:
-            return []
-            
-        try:
-            result = subprocess.run(
-                [self.cli_path, 'board', 'list', '--format', 'json'],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10
-            )
-            return json.loads(result.stdout)
-        except Exception as e:
-            print(f"Error listing connected boards: {e}")
-            return []
-    
-    def compile_sketch(self, sketch_path: str, fqbn: str) -> Dict:
-        """Compile an Arduino sketch"""
+
+    def _run(self, args: Sequence[str], timeout: float) -> bytes:
+        """Run an Arduino CLI command and return its raw stdout"""
+        result = subprocess.run(
+            [self.cli_path, *args],
+            capture_output=True,
+            check=True,
+            timeout=timeout,
+            **SPAWN_KWARGS
+        )
+        return result.stdout
+
+    def _query(self, args: Sequence[str], parse: Callable[[bytes], Any],
+               timeout: float, default: Any = None, cache_key: Optional[Tuple] = None):
         if not self.available:
-            return {'success': False, 'error': 'Arduino CLI not available'}
-            
+            return default
+
+        if cache_key is not None:
+            hit, value = self._cache_get(cache_key)
+            if hit:
+                return value
         try:
-            result = subprocess.run(
-                [self.cli_path, 'compile', '--fqbn', fqbn, sketch_path],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=60
-            )
-            return {'success': True, 'output': result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {'success': False, 'error': e.stderr}
+            try:
+                value = parse(self._run(args, timeout))
+            except FallbackQuery as fallback:
+                value = fallback.parse(self._run(fallback.command, timeout))
         except Exception as e:
-            return {'success': False, 'error': str(e)}
-    
-    def upload_sketch(self, sketch_path: str, fqbn: str, port: str) -> Dict:
-        """Upload compiled sketch to board"""
+            print(f"Error running arduino-cli {' '.join(args[:2])}: {e}")
+            return default
+        if cache_key is not None:
+            self._cache_put(cache_key, value)
+        return value
+
+    def _action(self, args: Sequence[str], timeout: float,
+                output_dir: Optional[Path] = None, clears_cache: bool = False) -> Dict:
         if not self.available:
             return {'success': False, 'error': 'Arduino CLI not available'}
-            
+
         try:
-            result = subprocess.run(
-                [self.cli_path, 'upload', '--fqbn', fqbn, '--port', port, sketch_path],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=60
-            )
-            return {'success': True, 'output': result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {'success': False, 'error': e.stderr}
+            stdout = self._run(args, timeout)
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
+        if clears_cache:
+            self.clear_cache()
+        return self._success(stdout, output_dir)
@@ -2,74 +2,158 @@
 Circuit data model
 """
 
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from .component import Component, Connection
+from .component import DATACLASS_SLOTS, Component, Connection
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Circuit:
     """Complete circuit representation"""
     components: Dict[str, Component] = field(default_factory=dict)
     connections: List[Connection] = field(default_factory=list)
     name: str = "Untitled Circuit"
+    # Bumped by every add/remove so derived structures (e.g. the simulation
+    # node map) can tell when they are stale
+    _topology_version: int = field(default=0, init=False, repr=False, compare=False)
+    # Reverse indexes kept in sync by the add/remove methods
+    _conn_by_component: DefaultDict[str, List[Connection]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False, compare=False
+    )
+    _components_by_type: DefaultDict[str, Dict[str, Component]] = field(
+        default_factory=lambda: defaultdict(dict), init=False, repr=False, compare=False
+    )
+    # (topology version, floating components, short circuit count)
+    _validate_cache: Optional[Tuple[int, List[Component], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        for component in self.components.values():
+            self._components_by_type[component.type][component.id] = component
+        for connection in self.connections:
+            self._index_connection(connection)
     
     def add_component(self, component: Component):
         """Add component to circuit"""
+        previous = self.components.get(component.id)
+        if previous is not None:
+            del self._components_by_type[previous.type][previous.id]
         self.components[component.id] = component
+        self._components_by_type[component.type][component.id] = component
+        self._topology_version += 1
         
     def remove_component(self, component_id: str):
         """Remove component from circuit"""
-        if component_id in self.components:
-            # Remove all connections involving this component
+        self.remove_components((component_id,))
+            
+    def remove_components(self, component_ids: Iterable[str]):
+        """Remove several components and all their connections in one pass"""
+        removed_ids = {cid for cid in component_ids if cid in self.components}
+        if not removed_ids:
+            return
+        # Remove all connections involving these components
+        removed_conns: Dict[str, Connection] = {}
+        for cid in removed_ids:
+            for conn in self._conn_by_component.pop(cid, ()):
+                removed_conns[conn.id] = conn
+        if removed_conns:
+            for conn in removed_conns.values():
+                for other_id in {conn.from_component, conn.to_component} - removed_ids:
+                    self._unindex(other_id, conn)
             self.connections = [
-                conn for conn in self.connections
-                if conn.from_component != component_id and conn.to_component != component_id
+                conn for conn in self.connections if conn.id not in removed_conns
             ]
-            del self.components[component_id]
+        for cid in removed_ids:
+            component = self.components.pop(cid)
+            del self._components_by_type[component.type][cid]
+        self._topology_version += 1
             
     def get_component(self, component_id: str) -> Optional[Component]:
         """Get component by ID"""
         return self.components.get(component_id)
         
+    def get_components_by_type(self, component_type: str) -> List[Component]:
+        """Get all components of a type"""
+        return list(self._components_by_type.get(component_type, {}).values())
+        
     def add_connection(self, connection: Connection):
         """Add connection between components"""
         self.connections.append(connection)
+        self._index_connection(connection)
+        self._topology_version += 1
         
     def remove_connection(self, connection_id: str):
         """Remove connection"""
-        self.connections = [
-            conn for conn in self.connections
-            if conn.id != connection_id
-        ]
+        kept = []
+        for conn in self.connections:
+            if conn.id != connection_id:
+                kept.append(conn)
+                continue
+            for component_id in {conn.from_component, conn.to_component}:
+                self._unindex(component_id, conn)
+        self.connections = kept
+        self._topology_version += 1
         
     def get_connections_for_component(self, component_id: str) -> List[Connection]:
         """Get all connections for a component"""
-        return [
-            conn for conn in self.connections
-            if conn.from_component == component_id or conn.to_component == component_id
-        ]
+        return list(self._conn_by_component.get(component_id, ()))
+        
+    def _index_connection(self, connection: Connection):
+        for component_id in {connection.from_component, connection.to_component}:
+            self._conn_by_component[component_id].append(connection)
+            
+    def _unindex(self, component_id: str, connection: Connection):
+        conns = self._conn_by_component.get(component_id)
+        if conns is not None:
+            conns.remove(connection)
+            if not conns:
+                del self._conn_by_component[component_id]
         
     def validate(self) -> List[str]:
-        """Validate circuit and return list of errors"""
-        errors = []
+        """Validate circuit and return list of errors
+
+        The checks only depend on the topology, so their findings are
+        cached until the next add/remove. Messages are formatted on each
+        call so they pick up renamed components.
+        """
+        if self._validate_cache is None or self._validate_cache[0] != self._topology_version:
+            self._validate_cache = (self._topology_version, *self._check_topology())
+        _, floating, short_circuits = self._validate_cache
+        
+        errors = [f"Component {component.name} has no connections" for component in floating]
+        errors.extend(
+            ["Short circuit detected: Battery terminals directly connected"] * short_circuits
+        )
+        return errors
+        
+    def _check_topology(self) -> Tuple[List[Component], int]:
+        """Return the floating components and the number of short circuits found"""
+        # Index connections by pin and note connected components in one pass
+        pin_conns: Dict[Tuple[str, str], List[Connection]] = defaultdict(list)
+        comp_has_conn: Set[str] = set()
+        for conn in self.connections:
+            from_key = (conn.from_component, conn.from_pin)
+            to_key = (conn.to_component, conn.to_pin)
+            pin_conns[from_key].append(conn)
+            if to_key != from_key:
+                pin_conns[to_key].append(conn)
+            comp_has_conn.add(conn.from_component)
+            comp_has_conn.add(conn.to_component)
         
         # Check for floating components (no connections)
-        for comp_id, component in self.components.items():
-            conns = self.get_connections_for_component(comp_id)
-            if not conns and component.type not in ['battery']:
-                errors.append(f"Component {component.name} has no connections")
+        floating = [
+            component for comp_id, component in self.components.items()
+            if comp_id not in comp_has_conn and component.type not in ['battery']
+        ]
                 
         # Check for short circuits (direct battery terminal connections)
+        short_circuits = 0
         for component in self.components.values():
             if component.type == 'battery':
-                # Check if positive and negative are directly connected
-                pos_connections = [c for c in self.connections 
-                                 if (c.from_component == component.id and c.from_pin == 'positive') or
-                                    (c.to_component == component.id and c.to_pin == 'positive')]
-                neg_connections = [c for c in self.connections
-                                 if (c.from_component == component.id and c.from_pin == 'negative') or
-                                    (c.to_component == component.id and c.to_pin == 'negative')]
+                pos_connections = pin_conns.get((component.id, 'positive'), ())
+                neg_connections = pin_conns.get((component.id, 'negative'), ())
                                     
                 # Check for direct connections without load
                 for pos_conn in pos_connections:
@@ -81,6 +165,6 @@ class Circuit:
                                 else pos_conn.from_component
                             )
                             if load_comp and load_comp.type == 'battery':
-                                errors.append("Short circuit detected: Battery terminals directly connected")
+                                short_circuits += 1
                                 
-        return errors
+        return floating, short_circuits
@@ -4,10 +4,27 @@ Component data models
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
+import itertools
+import sys
 import uuid
 
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Ids only have to be unique, not random. A counter is much cheaper than
+# uuid4(), and the per-process prefix keeps ids from another session
+# (e.g. a loaded project) from colliding with new ones. The counter comes
+# first so that shortened ids (id[:8]) still tell items apart.
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_ids = itertools.count(1)
+
+
+def _new_id(kind: str) -> str:
+    return f'{kind}{next(_ids)}-{_ID_PREFIX}'
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Pin:
     """Component pin/terminal"""
     name: str
@@ -18,21 +35,33 @@ class Pin:
     connected_to: List[str] = field(default_factory=list)  # List of connection IDs
 
 
-@dataclass
-class Component:
+class _PinIndex:
+    """Holds Component's pin name index outside its dataclass fields, so
+    asdict() and the generated __init__ never see it"""
+    __slots__ = ('_pin_by_name',)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Component(_PinIndex):
     """Base component class"""
     type: str
     name: str
     pins: List[Pin]
     properties: Dict = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: _new_id('c'))
+    
+    def __post_init__(self):
+        # First pin wins if names repeat, matching a front-to-back scan
+        self._pin_by_name: Dict[str, Pin] = {pin.name: pin for pin in reversed(self.pins)}
     
     def get_pin(self, pin_name: str) -> Optional[Pin]:
         """Get pin by name"""
-        for pin in self.pins:
-            if pin.name == pin_name:
-                return pin
-        return None
+        return self._pin_by_name.get(pin_name)
+        
+    def add_pin(self, pin: Pin):
+        """Add a pin, keeping the name index in sync"""
+        self.pins.append(pin)
+        self._pin_by_name.setdefault(pin.name, pin)
         
     def set_property(self, key: str, value):
         """Set component property"""
@@ -43,12 +72,15 @@ class Component:
         return self.properties.get(key, default)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Connection:
-    """Connection between component pins"""
+    """Connection between component pins
+
+    Connections are immutable; replace one to rewire a pin.
+    """
     from_component: str
     from_pin: str
     to_component: str
     to_pin: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: _new_id('w'))
     resistance: float = 0.001  # Wire resistance in ohms
@@ -5,9 +5,10 @@ Project data model
 from dataclasses import dataclass, field
 from typing import Optional
 from .circuit import Circuit
+from .component import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Project:
     """Project containing circuit and code"""
     circuit: Circuit = field(default_factory=Circuit)
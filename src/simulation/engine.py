@@ -4,11 +4,48 @@ Simulates electrical behavior of components
 """
 
 import numpy as np
-from typing import Dict, List, Optional
+from scipy import sparse
+from scipy.sparse import csgraph, linalg as splinalg
+from typing import Callable, Dict, List, Optional
 from ..models.circuit import Circuit
 from ..models.component import Component, Pin
 
 
+# Conductance from every node to ground so floating nodes stay solvable
+GMIN = 1e-12
+
+# Piecewise-linear LED model
+LED_ON_RESISTANCE = 1.0
+LED_OFF_CONDUCTANCE = 1e-9
+MAX_LED_ITERATIONS = 10
+
+# Pin state only feeds the display, so single precision is plenty. The
+# MNA solve stays in float64: GMIN and LED leakage sit far below float32
+# resolution next to ordinary conductances.
+STATE_DTYPE = np.float32
+
+
+def _property_array(components: List[Component], key: str, default: float,
+                    dtype=STATE_DTYPE) -> np.ndarray:
+    """Gather one property of each component into an array"""
+    return np.fromiter(
+        (component.properties.get(key, default) for component in components),
+        dtype=dtype, count=len(components)
+    )
+
+
+def _stamp(i: np.ndarray, j: np.ndarray, g: np.ndarray, ground: int):
+    """COO entries stamping conductances g between MNA nodes i and j
+
+    Entries touching the ground index (or beyond) are dropped.
+    """
+    rows = np.concatenate((i, j, i, j))
+    cols = np.concatenate((i, j, j, i))
+    data = np.concatenate((g, g, -g, -g))
+    keep = (rows < ground) & (cols < ground)
+    return rows[keep], cols[keep], data[keep]
+
+
 class SimulationEngine:
     """Circuit simulation engine using modified nodal analysis"""
     
@@ -17,12 +54,42 @@ class SimulationEngine:
         self.time = 0.0
         self.node_voltages: Dict[str, float] = {}
         self.component_currents: Dict[str, Dict[str, float]] = {}
+        self.nodes: Dict[str, List[tuple]] = {}
+        self.pin_to_node: Dict[tuple, str] = {}
+        self._node_map_key: Optional[tuple] = None
+        # Current delivered by each battery, from the last solve
+        self.source_currents: Dict[str, float] = {}
+        # LED conduction states, carried over as the next solve's first guess
+        self._led_on: Dict[str, bool] = {}
+        # Factorized MNA matrix and the inputs it was built from
+        self._factor: Optional[Callable[[np.ndarray], np.ndarray]] = None
+        self._factor_key: Optional[tuple] = None
+        self._build_state_arrays()
         
-    def reset(self):
-        """Reset simulation state"""
+    def reset(self, circuit: Optional[Circuit] = None):
+        """Reset simulation state
+
+        Passing a circuit switches the engine to it, so a view that starts
+        a new circuit can keep its engine instead of constructing another.
+        """
+        if circuit is not None:
+            self.circuit = circuit
+            self.nodes = {}
+            self.pin_to_node = {}
+            # A new circuit can reuse a freed one's id and version
+            self._node_map_key = None
+            self._build_state_arrays()
         self.time = 0.0
         self.node_voltages.clear()
         self.component_currents.clear()
+        self.source_currents.clear()
+        self._led_on.clear()
+        self._factor = None
+        self._factor_key = None
+        # Views may zero the Pin objects when a simulation stops, so the
+        # first step after a reset writes and reports every pin
+        self._shown_voltage.fill(np.nan)
+        self._shown_current.fill(np.nan)
         
     def step(self, dt: float):
         """Perform one simulation time step"""
@@ -34,252 +101,331 @@ class SimulationEngine:
         self.update_component_states()
         
     def build_node_map(self):
-        """Build map of electrical nodes from connections"""
-        # Each connection creates a node
-        # Connected pins share the same node
-        self.nodes: Dict[str, List[tuple]] = {}  # node_id -> [(comp_id, pin_name), ...]
-        node_counter = 0
-        
-        # Ground node (reference)
-        self.nodes['gnd'] = []
-        
-        # Track which pins have been assigned nodes
-        pin_to_node: Dict[tuple, str] = {}
-        
+        """Build map of electrical nodes from connections
+
+        Connected pins share a node. Pins are interned to integer ids and
+        grouped by scipy's connected-components labelling, and the result
+        is reused until the circuit's topology changes.
+        """
+        key = (id(self.circuit), self.circuit._topology_version)
+        if key == self._node_map_key:
+            return
+
+        # Intern each (comp_id, pin_name) key to a dense integer id
+        pin_index: Dict[tuple, int] = {}
+        pin_keys: List[tuple] = []
+        edges: List[int] = []
         for connection in self.circuit.connections:
-            from_pin_key = (connection.from_component, connection.from_pin)
-            to_pin_key = (connection.to_component, connection.to_pin)
-            
-            # Check if either pin already has a node
-            from_node = pin_to_node.get(from_pin_key)
-            to_node = pin_to_node.get(to_pin_key)
-            
-            if from_node and to_node:
-                # Both pins have nodes - merge them
-                if from_node != to_node:
-                    self.nodes[from_node].extend(self.nodes[to_node])
-                    for pin in self.nodes[to_node]:
-                        pin_to_node[pin] = from_node
-                    del self.nodes[to_node]
-            elif from_node:
-                # Only from pin has node
-                self.nodes[from_node].append(to_pin_key)
-                pin_to_node[to_pin_key] = from_node
-            elif to_node:
-                # Only to pin has node
-                self.nodes[to_node].append(from_pin_key)
-                pin_to_node[from_pin_key] = to_node
-            else:
-                # Neither has node - create new one
-                node_id = f'n{node_counter}'
-                node_counter += 1
-                self.nodes[node_id] = [from_pin_key, to_pin_key]
-                pin_to_node[from_pin_key] = node_id
-                pin_to_node[to_pin_key] = node_id
-                
-        # Identify ground connections (battery negative terminals)
-        for component in self.circuit.components.values():
-            if component.type == 'battery':
-                neg_pin_key = (component.id, 'negative')
-                if neg_pin_key in pin_to_node:
-                    # Set this node as ground
-                    node_id = pin_to_node[neg_pin_key]
-                    self.nodes['gnd'].extend(self.nodes[node_id])
-                    for pin in self.nodes[node_id]:
-                        pin_to_node[pin] = 'gnd'
-                    if node_id != 'gnd':
-                        del self.nodes[node_id]
-                        
+            for pin_key in ((connection.from_component, connection.from_pin),
+                            (connection.to_component, connection.to_pin)):
+                pin_id = pin_index.get(pin_key)
+                if pin_id is None:
+                    pin_id = pin_index[pin_key] = len(pin_keys)
+                    pin_keys.append(pin_key)
+                edges.append(pin_id)
+
+        # Label connected pins in compiled code. Labels are assigned in
+        # order of each group's lowest pin id, i.e. order of first appearance.
+        n = len(pin_keys)
+        edges = np.array(edges, dtype=np.int32).reshape(-1, 2)
+        graph = sparse.coo_matrix(
+            (np.ones(len(edges), dtype=np.int8), (edges[:, 0], edges[:, 1])), shape=(n, n)
+        )
+        _, labels = csgraph.connected_components(graph, directed=False)
+        labels = labels.tolist()
+
+        # Battery negative terminals are the ground reference
+        ground_labels = {
+            labels[pin_index[(component.id, 'negative')]]
+            for component in self.circuit.get_components_by_type('battery')
+            if (component.id, 'negative') in pin_index
+        }
+
+        self.nodes = {'gnd': []}  # node_id -> [(comp_id, pin_name), ...]
+        pin_to_node: Dict[tuple, str] = {}
+        label_to_node: Dict[int, str] = {label: 'gnd' for label in ground_labels}
+        for pin_key, label in zip(pin_keys, labels):
+            node_id = label_to_node.get(label)
+            if node_id is None:
+                node_id = label_to_node[label] = f'n{len(self.nodes) - 1}'
+                self.nodes[node_id] = []
+            self.nodes[node_id].append(pin_key)
+            pin_to_node[pin_key] = node_id
+
         self.pin_to_node = pin_to_node
+        self._build_state_arrays()
+        self._node_map_key = key
         
-    def solve_dc_circuit(self):
-        """Solve DC circuit using nodal analysis"""
-        # Simplified DC analysis for basic circuits
-        
-        # Initialize all nodes to 0V (except sources)
-        for node_id in self.nodes:
-            self.node_voltages[node_id] = 0.0
-            
-        # Set voltage source nodes
-        for component in self.circuit.components.values():
-            if component.type == 'battery':
-                voltage = component.properties.get('voltage', 5.0)
-                pos_pin_key = (component.id, 'positive')
-                if pos_pin_key in self.pin_to_node:
-                    pos_node = self.pin_to_node[pos_pin_key]
-                    self.node_voltages[pos_node] = voltage
-                    
-        # Iterative solver for resistive circuits
-        # (Simplified - for complex circuits, use matrix solver)
-        max_iterations = 100
-        tolerance = 0.001
+    def _build_state_arrays(self):
+        """Lay out pin state as contiguous arrays for the current node map
+
+        Every pin of a simulated component gets a slot in pin_voltage,
+        pin_current and pin_node. Node indices follow self.nodes without
+        'gnd', followed by two slots held at 0 V: ground, and a slot
+        shared by unconnected pins (which the solver leaves unstamped).
+        Per-type index arrays select each component type's pins so a
+        whole type can be handled in one NumPy expression.
+        """
+        node_ids = [n for n in self.nodes if n != 'gnd']
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+        ground = node_index['gnd'] = len(node_ids)
+        floating = ground + 1
+        pins: List[Pin] = []
+        pin_node: List[int] = []
+        component_slots: Dict[str, List[int]] = {}
+        pin_slots: Dict[tuple, int] = {}
+
+        def layout(component_type: str, pin_names: tuple):
+            components = [
+                c for c in self.circuit.get_components_by_type(component_type)
+                if all(c.get_pin(name) for name in pin_names)
+            ]
+            slots: List[List[int]] = [[] for _ in pin_names]
+            for component in components:
+                component_slots[component.id] = [len(pins) + k for k in range(len(pin_names))]
+                for name, type_slots in zip(pin_names, slots):
+                    pin_slots[(component.id, name)] = len(pins)
+                    type_slots.append(len(pins))
+                    pins.append(component.get_pin(name))
+                    pin_node.append(node_index.get(self.pin_to_node.get((component.id, name)), floating))
+            return components, [np.array(type_slots, dtype=np.int32) for type_slots in slots]
+
+        self._batteries, (self._bat_pos, self._bat_neg) = layout('battery', ('positive', 'negative'))
+        self._resistors, (self._res_p1, self._res_p2) = layout('resistor', ('pin1', 'pin2'))
+        self._leds, (self._led_anode, self._led_cathode) = layout('led', ('anode', 'cathode'))
+
+        # Each component's pins as (current in, current out) branch ends,
+        # ordered batteries, resistors, LEDs
+        self._branch_in = np.concatenate((self._bat_pos, self._res_p1, self._led_anode))
+        self._branch_out = np.concatenate((self._bat_neg, self._res_p2, self._led_cathode))
+        self._node_ids = node_ids
+        self._node_index = node_index
+        self._component_slots = component_slots
+        self._pin_slots = pin_slots
+        self._pins = pins
+        self.pin_node = np.array(pin_node, dtype=np.int32)
+        self.pin_voltage = np.zeros(len(pins), dtype=STATE_DTYPE)
+        self.pin_current = np.zeros(len(pins), dtype=STATE_DTYPE)
+        # Values last copied to the Pin objects; NaN forces the first copy
+        self._shown_voltage = np.full(len(pins), np.nan, dtype=STATE_DTYPE)
+        self._shown_current = np.full(len(pins), np.nan, dtype=STATE_DTYPE)
+        # Pins whose state changed in the last step, so views can repaint
+        # only those
+        self.changed_pins: List[Pin] = []
+        self._voltages = np.zeros(floating + 1)
+        # Per-step component parameters and solved source currents
+        self._bat_voltage = np.zeros(len(self._batteries), dtype=STATE_DTYPE)
+        self._source_current = np.zeros(len(self._batteries), dtype=STATE_DTYPE)
+        self._res_conductance = np.zeros(len(self._resistors), dtype=STATE_DTYPE)
+        self._led_forward_voltage = np.zeros(len(self._leds), dtype=STATE_DTYPE)
+
+        # Everything the solver derives from the topology alone, so each
+        # step only gathers component values and solves
+        node = self.pin_node
+        # Batteries with a live positive terminal become voltage sources
+        self._sources = np.flatnonzero(node[self._bat_pos] < ground)
+        self._source_nodes = node[self._bat_pos][self._sources]
+        self._source_ids = [self._batteries[k].id for k in self._sources.tolist()]
+        # Resistors with both pins connected
+        self._res_i, self._res_j = node[self._res_p1], node[self._res_p2]
+        self._res_connected = (self._res_i <= ground) & (self._res_j <= ground)
+        # LEDs with both pins connected; terminals at ground take no
+        # Norton current
+        anode, cathode = node[self._led_anode], node[self._led_cathode]
+        self._led_stamped = np.flatnonzero((anode <= ground) & (cathode <= ground))
+        self._led_i, self._led_j = anode[self._led_stamped], cathode[self._led_stamped]
+        self._led_ids = [self._leds[k].id for k in self._led_stamped.tolist()]
+        self._led_anode_live = self._led_i < ground
+        self._led_cathode_live = self._led_j < ground
         
-        for iteration in range(max_iterations):
-            old_voltages = self.node_voltages.copy()
-            
-            # Update node voltages based on connected components
-            for node_id, pins in self.nodes.items():
-                if node_id == 'gnd':
-                    continue
-                    
-                # Check if this node is directly connected to a voltage source
-                is_source_node = False
-                for comp_id, pin_name in pins:
-                    component = self.circuit.get_component(comp_id)
-                    if component and component.type == 'battery' and pin_name == 'positive':
-                        is_source_node = True
-                        break
-                        
-                if is_source_node:
-                    continue  # Voltage is fixed
-                    
-                # For other nodes, calculate based on neighboring nodes and resistances
-                # This is a simplified approach
-                self.update_node_voltage(node_id)
-                
-            # Check convergence
-            max_change = max(abs(self.node_voltages[n] - old_voltages.get(n, 0)) 
-                           for n in self.node_voltages)
-            if max_change < tolerance:
+    def solve_dc_circuit(self):
+        """Solve DC node voltages using modified nodal analysis
+
+        Resistors and batteries are stamped into a sparse MNA system. LEDs
+        are piecewise-linear: a forward voltage drop behind
+        LED_ON_RESISTANCE while conducting, a leakage conductance
+        otherwise. The system is re-solved until every LED's state agrees
+        with its voltage, starting from the states of the previous step.
+
+        Stamps are assembled from integer node arrays precomputed for the
+        topology, so no pin keys are hashed per step.
+        """
+        n = len(self._node_ids)  # index n is ground, n + 1 unconnected
+
+        # Resistors with a positive resistance
+        resistance = _property_array(self._resistors, 'resistance', 1000.0, dtype=float)
+        conductance = np.divide(1.0, resistance, out=np.zeros_like(resistance), where=resistance > 0)
+
+        # One extra unknown per voltage source: the current into its
+        # positive terminal. The negative terminal is the ground reference.
+        sources = self._sources
+        m = len(sources)
+        rhs = np.zeros(n + m)
+        voltage = _property_array(self._batteries, 'voltage', 5.0, dtype=float)
+        rhs[n:] = voltage[sources]
+        forward_voltage = _property_array(self._leds, 'forward_voltage', 2.0, dtype=float)
+
+        # Kept for update_component_states
+        self._res_conductance[:] = conductance
+        self._bat_voltage[:] = voltage
+        self._led_forward_voltage[:] = forward_voltage
+
+        self.node_voltages.clear()
+        self.node_voltages['gnd'] = 0.0
+        self.source_currents.clear()
+        self._source_current[:] = 0.0
+        self._voltages[:] = 0.0
+        if not len(rhs):
+            return
+
+        def static_entries():
+            """COO entries for everything but the LEDs"""
+            keep = self._res_connected & (conductance > 0)
+            res_rows, res_cols, res_data = _stamp(
+                self._res_i[keep], self._res_j[keep], conductance[keep], n
+            )
+            branch = np.arange(n, n + m)
+            diagonal = np.arange(n)
+            return (
+                np.concatenate((res_rows, diagonal, self._source_nodes, branch)),
+                np.concatenate((res_cols, diagonal, branch, self._source_nodes)),
+                # A tiny conductance to ground keeps floating nodes solvable
+                np.concatenate((res_data, np.full(n, GMIN), np.ones(2 * m))),
+            )
+
+        led_i, led_j = self._led_i, self._led_j
+        anode_live, cathode_live = self._led_anode_live, self._led_cathode_live
+        v_forward = forward_voltage[self._led_stamped]
+        led_ids = self._led_ids
+        on = np.fromiter((self._led_on.get(led_id, False) for led_id in led_ids),
+                         dtype=bool, count=len(led_ids))
+
+        # The matrix only depends on the topology, the resistor values and
+        # the LED states, so its factorization is reused while those hold
+        # and each step only pays for the triangular solves
+        static_key = (self._node_map_key, conductance.tobytes())
+        static = None
+
+        # Per-iteration buffers, refilled in place
+        b = np.empty_like(rhs)
+        v = np.zeros(n + 1)
+
+        for _ in range(MAX_LED_ITERATIONS):
+            led_conductance = np.where(on, 1.0 / LED_ON_RESISTANCE, LED_OFF_CONDUCTANCE)
+            # Forward drop of conducting LEDs as Norton current sources;
+            # np.add.at accumulates LEDs sharing a node
+            norton = np.where(on, led_conductance * v_forward, 0.0)
+            b[:] = rhs
+            np.add.at(b, led_i[anode_live], norton[anode_live])
+            np.subtract.at(b, led_j[cathode_live], norton[cathode_live])
+
+            key = (static_key, on.tobytes())
+            if key != self._factor_key:
+                if static is None:
+                    static = static_entries()
+                entries = zip(static, _stamp(led_i, led_j, led_conductance, n))
+                rows, cols, data = (np.concatenate(pair) for pair in entries)
+                self._factor = self._factorize(rows, cols, data, len(b))
+                self._factor_key = key
+            x = self._factor(b)
+
+            # Each LED's state must agree with its solved forward bias
+            v[:n] = x[:n]
+            new_on = v[led_i] - v[led_j] > v_forward
+            converged = np.array_equal(new_on, on)
+            on = new_on
+            if converged:
                 break
-                
-    def update_node_voltage(self, node_id: str):
-        """Update voltage at a node based on connected components"""
-        # Simplified voltage calculation
-        # In a real implementation, this would use KCL and component models
-        pass
+        self._led_on.update(zip(led_ids, on.tolist()))
+
+        self._voltages[:n] = x[:n]
+        self.node_voltages.update(zip(self._node_ids, x[:n].tolist()))
+        # Current delivered is the current leaving the positive terminal
+        delivered = -x[n:]
+        self._source_current[sources] = delivered
+        self.source_currents.update(zip(self._source_ids, delivered.tolist()))
+
+    @staticmethod
+    def _factorize(rows: np.ndarray, cols: np.ndarray, data: np.ndarray,
+                   size: int) -> Callable[[np.ndarray], np.ndarray]:
+        """Factorize the sparse MNA matrix given in COO form
+
+        Returns a function solving the system for a right-hand side.
+        """
+        matrix = sparse.coo_matrix((data, (rows, cols)), shape=(size, size)).tocsc()
+        try:
+            return splinalg.splu(matrix).solve
+        except RuntimeError:
+            # Singular, e.g. two sources forced onto one node; fall back to
+            # the least-squares solution
+            dense = matrix.toarray()
+            return lambda b: np.linalg.lstsq(dense, b, rcond=None)[0]
         
     def update_component_states(self):
-        """Update component pin voltages and currents"""
-        for component in self.circuit.components.values():
-            self.update_component(component)
-            
-    def update_component(self, component: Component):
-        """Update individual component state"""
-        if component.type == 'battery':
-            self.update_battery(component)
-        elif component.type == 'resistor':
-            self.update_resistor(component)
-        elif component.type == 'led':
-            self.update_led(component)
-            
-    def update_battery(self, component: Component):
-        """Update battery component"""
-        voltage = component.properties.get('voltage', 5.0)
-        
-        # Set pin voltages
-        pos_pin = component.get_pin('positive')
-        neg_pin = component.get_pin('negative')
-        
-        if pos_pin:
-            pos_pin.voltage = voltage
-            # Calculate current based on load
-            pos_pin.current = self.calculate_output_current(component, 'positive')
-            
-        if neg_pin:
-            neg_pin.voltage = 0.0
-            neg_pin.current = -pos_pin.current if pos_pin else 0.0
-            
-    def update_resistor(self, component: Component):
-        """Update resistor component"""
-        resistance = component.properties.get('resistance', 1000.0)
-        
-        pin1 = component.get_pin('pin1')
-        pin2 = component.get_pin('pin2')
-        
-        if pin1 and pin2:
-            # Get node voltages
-            pin1_key = (component.id, 'pin1')
-            pin2_key = (component.id, 'pin2')
-            
-            v1 = self.node_voltages.get(self.pin_to_node.get(pin1_key, 'gnd'), 0.0)
-            v2 = self.node_voltages.get(self.pin_to_node.get(pin2_key, 'gnd'), 0.0)
-            
-            pin1.voltage = v1
-            pin2.voltage = v2
-            
-            # Ohm's law: I = V/R
-            current = (v1 - v2) / resistance if resistance > 0 else 0.0
-            pin1.current = current
-            pin2.current = -current
-            
-    def update_led(self, component: Component):
-        """Update LED component"""
-        forward_voltage = component.properties.get('forward_voltage', 2.0)
-        max_current = component.properties.get('max_current', 0.020)
-        
-        anode = component.get_pin('anode')
-        cathode = component.get_pin('cathode')
-        
-        if anode and cathode:
-            # Get node voltages
-            anode_key = (component.id, 'anode')
-            cathode_key = (component.id, 'cathode')
-            
-            v_anode = self.node_voltages.get(self.pin_to_node.get(anode_key, 'gnd'), 0.0)
-            v_cathode = self.node_voltages.get(self.pin_to_node.get(cathode_key, 'gnd'), 0.0)
-            
-            anode.voltage = v_anode
-            cathode.voltage = v_cathode
-            
-            # LED model: conducts if forward biased
-            voltage_drop = v_anode - v_cathode
-            
-            if voltage_drop > forward_voltage:
-                # Simple model: LED conducts with forward voltage drop
-                # Current limited by series resistance in circuit
-                current = self.calculate_led_current(component, voltage_drop, forward_voltage)
-                current = min(current, max_current)
-            else:
-                current = 0.0
-                
-            anode.current = current
-            cathode.current = -current
+        """Update component pin voltages and currents
+
+        Every component is a two-terminal branch, so all branch currents
+        are computed by type in vectorised expressions and scattered into
+        pin_current in one pass. State is copied to the Pin objects once
+        at the end, since the canvas reads pins on every frame. Only pins
+        whose values changed are written, and they are listed in
+        changed_pins.
+        """
+        pin_voltage = self.pin_voltage
+        pin_voltage[:] = self._voltages[self.pin_node]
+        # Batteries show their rated voltage even when open
+        pin_voltage[self._bat_pos] = self._bat_voltage
+        pin_voltage[self._bat_neg] = 0.0
+
+        # Resistors: Ohm's law
+        res_current = (pin_voltage[self._res_p1] - pin_voltage[self._res_p2]) * self._res_conductance
+        # LEDs conduct through the on-resistance when forward biased
+        drop = pin_voltage[self._led_anode] - pin_voltage[self._led_cathode]
+        forward_voltage = self._led_forward_voltage
+        max_current = _property_array(self._leds, 'max_current', 0.020)
+        led_current = np.where(
+            drop > forward_voltage,
+            np.minimum((drop - forward_voltage) / LED_ON_RESISTANCE, max_current),
+            0.0
+        )
+
+        pin_current = self.pin_current
+        branch_current = np.concatenate((self._source_current, res_current, led_current))
+        pin_current[self._branch_in] = branch_current
+        pin_current[self._branch_out] = -branch_current
+
+        changed = np.flatnonzero(
+            (pin_voltage != self._shown_voltage) | (pin_current != self._shown_current)
+        )
+        self._shown_voltage[changed] = pin_voltage[changed]
+        self._shown_current[changed] = pin_current[changed]
+        pins = self._pins
+        self.changed_pins = [pins[k] for k in changed.tolist()]
+        for pin, voltage, current in zip(self.changed_pins, pin_voltage[changed].tolist(),
+                                         pin_current[changed].tolist()):
+            pin.voltage = voltage
+            pin.current = current
             
     def calculate_output_current(self, component: Component, pin_name: str) -> float:
-        """Calculate current output from a source pin"""
-        # Sum currents through all loads
-        total_current = 0.0
+        """Current output from a source pin, as found by the last solve"""
+        current = self.source_currents.get(component.id, 0.0)
+        return current if pin_name == 'positive' else -current
         
-        # Find all components connected to this pin
-        pin_key = (component.id, pin_name)
-        if pin_key not in self.pin_to_node:
-            return 0.0
-            
-        node_id = self.pin_to_node[pin_key]
-        
-        # Calculate total conductance and current
-        for comp in self.circuit.components.values():
-            if comp.type == 'resistor':
-                # Check if resistor is connected to this node
-                if self.is_component_on_node(comp, node_id):
-                    resistance = comp.properties.get('resistance', 1000.0)
-                    voltage = component.properties.get('voltage', 5.0)
-                    total_current += voltage / resistance
-                    
-        return total_current
-        
-    def calculate_led_current(self, led: Component, v_drop: float, v_forward: float) -> float:
-        """Calculate LED current based on series resistance"""
-        # Find series resistor
-        for connection in self.circuit.connections:
-            if connection.to_component == led.id or connection.from_component == led.id:
-                # Check if connected component is a resistor
-                other_id = (connection.from_component if connection.to_component == led.id 
-                           else connection.to_component)
-                other = self.circuit.get_component(other_id)
-                
-                if other and other.type == 'resistor':
-                    resistance = other.properties.get('resistance', 220.0)
-                    # I = (V_supply - V_led) / R
-                    current = max(0, (v_drop - v_forward) / resistance)
-                    return current
-                    
-        # No series resistor found - limit current
-        return 0.001  # 1mA default
+    def pin_slot(self, component_id: str, pin_name: str) -> Optional[int]:
+        """Index of a pin in pin_voltage, pin_current and pin_node
+
+        Lets views read pin state straight from the arrays. Slots are
+        reassigned when the topology changes, so look them up again after
+        an edit. Returns None for pins the engine does not simulate.
+        """
+        return self._pin_slots.get((component_id, pin_name))
         
     def is_component_on_node(self, component: Component, node_id: str) -> bool:
         """Check if component is connected to a node"""
+        slots = self._component_slots.get(component.id)
+        node = self._node_index.get(node_id)
+        if slots is not None and node is not None:
+            return bool(np.any(self.pin_node[slots] == node))
         for pin in component.pins:
             pin_key = (component.id, pin.name)
             if pin_key in self.pin_to_node:
@@ -2,6 +2,18 @@
 # This shows the additions needed for better connection visualization
 
 # ... existing imports ...
+import sys
+from .qt_compat import CONTROL_MODIFIER, KEY_D, KEY_DELETE, KEY_ESCAPE, QColor, QPen
+
+# Wire pens are shared rather than rebuilt on every highlight
+_WIRE_PEN = QPen(QColor(50, 150, 50), 3)
+_HIGHLIGHT_PEN = QPen(QColor(255, 255, 0), 5)  # Yellow, thick
+
+_RULE = "=" * 60
+
+# CanvasView.wire_items maps connection id -> WireGraphicsItem (initialise
+# it as {} in CanvasView.__init__), so a connection's wire is found without
+# scanning every wire on the canvas
 
 def add_connection_tracing_to_canvas():
     """
@@ -11,97 +23,90 @@ def add_connection_tracing_to_canvas():
 
 # Add this method to CanvasView class:
 def show_connection_trace(self):
-    """Show all connections in a debug window"""
-    print("\n" + "="*60)
-    print("CONNECTION TRACE")
-    print("="*60)
+    """Show all connections in a debug window
+
+    The report is assembled in memory and written to stdout in one call,
+    so the key handler that triggers it is not held up by per-line I/O.
+    """
+    lines = ["", _RULE, "CONNECTION TRACE", _RULE]
     
     if not self.circuit.connections:
-        print("No connections found")
+        lines.append("No connections found")
+        _write_lines(lines)
         return
     
     for i, conn in enumerate(self.circuit.connections, 1):
         from_comp = self.circuit.get_component(conn.from_component)
         to_comp = self.circuit.get_component(conn.to_component)
         
-        print(f"\n{i}. Connection ID: {conn.id}")
+        lines.append(f"\n{i}. Connection ID: {conn.id}")
         if from_comp:
-            print(f"   FROM: {from_comp.name} ({from_comp.type})")
-            print(f"         Pin: {conn.from_pin}")
+            lines.append(f"   FROM: {from_comp.name} ({from_comp.type})")
+            lines.append(f"         Pin: {conn.from_pin}")
             from_pin = from_comp.get_pin(conn.from_pin)
             if from_pin:
-                print(f"         Voltage: {from_pin.voltage:.2f}V")
-                print(f"         Current: {from_pin.current*1000:.2f}mA")
+                lines.append(f"         Voltage: {from_pin.voltage:.2f}V")
+                lines.append(f"         Current: {from_pin.current*1000:.2f}mA")
         
         if to_comp:
-            print(f"   TO:   {to_comp.name} ({to_comp.type})")
-            print(f"         Pin: {conn.to_pin}")
+            lines.append(f"   TO:   {to_comp.name} ({to_comp.type})")
+            lines.append(f"         Pin: {conn.to_pin}")
             to_pin = to_comp.get_pin(conn.to_pin)
             if to_pin:
-                print(f"         Voltage: {to_pin.voltage:.2f}V")
-                print(f"         Current: {to_pin.current*1000:.2f}mA")
+                lines.append(f"         Voltage: {to_pin.voltage:.2f}V")
+                lines.append(f"         Current: {to_pin.current*1000:.2f}mA")
     
-    print("\n" + "="*60)
+    lines.append("\n" + _RULE)
     
     # Show node map
-    print("\nELECTRICAL NODES")
-    print("="*60)
+    lines.append("\nELECTRICAL NODES")
+    lines.append(_RULE)
     self.simulation_engine.build_node_map()
     for node_id, pins in self.simulation_engine.nodes.items():
         voltage = self.simulation_engine.node_voltages.get(node_id, 0.0)
-        print(f"\nNode '{node_id}': {voltage:.2f}V")
+        lines.append(f"\nNode '{node_id}': {voltage:.2f}V")
         for comp_id, pin_name in pins:
             comp = self.circuit.get_component(comp_id)
             if comp:
-                print(f"  - {comp.name} ({comp.type}) pin '{pin_name}'")
-    print("\n" + "="*60)
+                lines.append(f"  - {comp.name} ({comp.type}) pin '{pin_name}'")
+    lines.append("\n" + _RULE)
+    _write_lines(lines)
+
+
+def _write_lines(lines):
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 # Add this method to CanvasView class:
 def highlight_connection(self, connection_id: str):
     """Highlight a specific connection"""
-    for wire_item in self.wire_items:
-        if wire_item.connection.id == connection_id:
-            # Highlight the wire
-            from .qt_compat import QPen, QColor
-            wire_item.setPen(QPen(QColor(255, 255, 0), 5))  # Yellow, thick
-            wire_item.setZValue(100)  # Bring to front
-            
-            # Flash effect
-            from .qt_compat import QTimer
-            def reset_wire():
-                wire_item.setPen(QPen(QColor(50, 150, 50), 3))
-                wire_item.setZValue(1)
-            QTimer.singleShot(2000, reset_wire)  # Reset after 2 seconds
-            break
+    wire_item = self.wire_items.get(connection_id)
+    if wire_item is not None:
+        # Highlight the wire
+        wire_item.setPen(_HIGHLIGHT_PEN)
+        wire_item.setZValue(100)  # Bring to front
+        
+        # Flash effect
+        from .qt_compat import QTimer
+        def reset_wire():
+            wire_item.setPen(_WIRE_PEN)
+            wire_item.setZValue(1)
+        QTimer.singleShot(2000, reset_wire)  # Reset after 2 seconds
 
 # Add this method to CanvasView class:
 def keyPressEvent(self, event):
     """Handle keyboard shortcuts"""
-    from .qt_compat import Qt
-    
-    try:
-        # PyQt6
-        if event.key() == Qt.Key.Key_D and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            self.show_connection_trace()
-        elif event.key() == Qt.Key.Key_Escape:
-            if self.wiring_mode:
-                self.cancel_wiring()
-        elif event.key() == Qt.Key.Key_Delete:
-            # Delete selected items
-            for item in self.scene.selectedItems():
-                if isinstance(item, ComponentGraphicsItem):
-                    self.remove_component(item.component.id)
-    except:
-        # PyQt5
-        if event.key() == Qt.Key_D and event.modifiers() == Qt.ControlModifier:
-            self.show_connection_trace()
-        elif event.key() == Qt.Key_Escape:
-            if self.wiring_mode:
-                self.cancel_wiring()
-        elif event.key() == Qt.Key_Delete:
-            for item in self.scene.selectedItems():
-                if isinstance(item, ComponentGraphicsItem):
-                    self.remove_component(item.component.id)
+    key = event.key()
+    if key == KEY_D and event.modifiers() == CONTROL_MODIFIER:
+        self.show_connection_trace()
+    elif key == KEY_ESCAPE:
+        if self.wiring_mode:
+            self.cancel_wiring()
+    elif key == KEY_DELETE:
+        # Delete selected items
+        for item in self.scene.selectedItems():
+            if isinstance(item, ComponentGraphicsItem):
+                self.remove_component(item.component.id)
     
     super().keyPressEvent(event)
 
@@ -114,15 +119,18 @@ def remove_component(self, component_id: str):
         self.scene.removeItem(graphics_item)
         del self.component_items[component_id]
         
+        # The circuit indexes connections by component, so the wires to
+        # drop are known without testing every wire's endpoints
+        removed = {conn.id for conn in self.circuit.get_connections_for_component(component_id)}
+        
         # Remove from circuit (this also removes connections)
         self.circuit.remove_component(component_id)
         
         # Remove wire graphics items
-        self.wire_items = [
-            wire for wire in self.wire_items
-            if wire.connection.from_component != component_id 
-            and wire.connection.to_component != component_id
-        ]
+        for conn_id in removed:
+            wire = self.wire_items.pop(conn_id, None)
+            if wire is not None:
+                self.scene.removeItem(wire)
         
         self.component_removed.emit(component_id)
         print(f"Removed component: {component_id}")
@@ -3,16 +3,56 @@ Component Library Panel
 """
 
 from .qt_compat import (
-    QWidget, QVBoxLayout, QListWidget, QLabel,
-    QListWidgetItem, QPushButton, QHBoxLayout, pyqtSignal
+    QWidget, QVBoxLayout, QListView, QLabel, QModelIndex,
+    QStandardItem, QStandardItemModel, QPushButton, QHBoxLayout, QFont,
+    pyqtSignal, NO_ITEM_FLAGS, USER_ROLE
 )
 
 
+# (category, entries) in display order
+COMPONENT_CATALOG = (
+    ("Power Sources", ["  Battery (5V)", "  Battery (3.3V)"]),
+    ("Output Devices", ["  LED (Red)", "  LED (Green)", "  LED (Blue)", "  RGB LED"]),
+    ("Passive Components", [
+        "  Resistor (220Ω)", "  Resistor (1kΩ)", "  Resistor (10kΩ)", "  Capacitor"
+    ]),
+    ("Input Devices", ["  Push Button", "  Potentiometer"]),
+)
+
+
+
+def _keyword_type(text: str) -> str:
+    """Component type named by keywords in an entry's text"""
+    text = text.lower()
+    if "battery" in text:
+        return "battery"
+    elif "led" in text and "rgb" not in text:
+        return "led"
+    elif "resistor" in text:
+        return "resistor"
+    elif "button" in text:
+        return "button"
+    elif "potentiometer" in text:
+        return "potentiometer"
+    return ""
+
+
+# Stripped entry text -> component type, resolved once at import
+CATALOG_TYPES = {
+    entry.strip(): _keyword_type(entry)
+    for _, entries in COMPONENT_CATALOG for entry in entries
+}
+
+
 class ComponentPanel(QWidget):
     """Component library panel"""
     
     component_selected = pyqtSignal(str, object)  # component_type, position
     
+    # Shared by all category headers; built on first use because QFont
+    # needs the application to exist
+    _category_font = None
+    
     def __init__(self):
         super().__init__()
         self.init_ui()
@@ -26,33 +66,25 @@ class ComponentPanel(QWidget):
         header = QLabel("<b>Components</b>")
         layout.addWidget(header)
         
-        # Component list
-        self.list_widget = QListWidget()
-        
-        # Power sources
-        self.add_category("Power Sources")
-        self.list_widget.addItem("  Battery (5V)")
-        self.list_widget.addItem("  Battery (3.3V)")
-        
-        self.add_category("Output Devices")
-        self.list_widget.addItem("  LED (Red)")
-        self.list_widget.addItem("  LED (Green)")
-        self.list_widget.addItem("  LED (Blue)")
-        self.list_widget.addItem("  RGB LED")
+        # Component list. The model is filled before the view is attached,
+        # so the view lays it out once. Each entry carries its component
+        # type, so clicks need no text parsing.
+        self.model = QStandardItemModel(self)
+        for category, entries in COMPONENT_CATALOG:
+            self.add_category(category)
+            for entry in entries:
+                item = QStandardItem(entry)
+                item.setEditable(False)
+                item.setData(CATALOG_TYPES[entry.strip()], USER_ROLE)
+                self.model.appendRow(item)
         
-        self.add_category("Passive Components")
-        self.list_widget.addItem("  Resistor (220Ω)")
-        self.list_widget.addItem("  Resistor (1kΩ)")
-        self.list_widget.addItem("  Resistor (10kΩ)")
-        self.list_widget.addItem("  Capacitor")
+        self.list_view = QListView()
+        # Every row has the same height, so Qt can skip per-row size hints
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.model)
+        self.list_view.doubleClicked.connect(self.on_item_double_clicked)
         
-        self.add_category("Input Devices")
-        self.list_widget.addItem("  Push Button")
-        self.list_widget.addItem("  Potentiometer")
-        
-        self.list_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
-        
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.list_view)
         
         # Add button
         button_layout = QHBoxLayout()
@@ -63,49 +95,31 @@ class ComponentPanel(QWidget):
         
     def add_category(self, name: str):
         """Add category header"""
-        item = QListWidgetItem(name)
-        try:
-            from .qt_compat import Qt
-            item.setFlags(Qt.ItemFlag.NoItemFlags)  # PyQt6
-        except:
-            from .qt_compat import Qt
-            item.setFlags(Qt.NoItemFlags)  # PyQt5
-        try:
-            from .qt_compat import QFont
+        item = QStandardItem(name)
+        item.setFlags(NO_ITEM_FLAGS)
+        if ComponentPanel._category_font is None:
             font = QFont()
             font.setBold(True)
-            item.setFont(font)
-        except:
-            pass
-        self.list_widget.addItem(item)
+            ComponentPanel._category_font = font
+        item.setFont(ComponentPanel._category_font)
+        self.model.appendRow(item)
         
-    def on_item_double_clicked(self, item: QListWidgetItem):
+    def on_item_double_clicked(self, index: QModelIndex):
         """Handle item double click"""
-        text = item.text().strip()
-        if not text or text.endswith(":"):
-            return
-            
-        component_type = self.parse_component_type(text)
+        # Category headers carry no type
+        component_type = index.data(USER_ROLE)
         if component_type:
             self.component_selected.emit(component_type, None)
             
     def on_add_clicked(self):
         """Handle add button click"""
-        current = self.list_widget.currentItem()
-        if current:
+        current = self.list_view.currentIndex()
+        if current.isValid():
             self.on_item_double_clicked(current)
             
     def parse_component_type(self, text: str) -> str:
         """Parse component type from list item text"""
-        text = text.lower()
-        if "battery" in text:
-            return "battery"
-        elif "led" in text and "rgb" not in text:
-            return "led"
-        elif "resistor" in text:
-            return "resistor"
-        elif "button" in text:
-            return "button"
-        elif "potentiometer" in text:
-            return "potentiometer"
-        return ""
+        component_type = CATALOG_TYPES.get(text)
+        if component_type is None:
+            component_type = _keyword_type(text)
+        return component_type
@@ -6,16 +6,49 @@ from .qt_compat import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QTabWidget, QStatusBar, QMenuBar,
     QMenu, QToolBar, QFileDialog, QMessageBox,
-    Qt, QAction, QIcon, QKeySequence, pyqtSignal
+    QAction, QIcon, QTimer, pyqtSignal, STANDARD_KEY, VERTICAL
 )
 
-from .canvas_view import CanvasView
-from .code_editor import CodeEditor
-from .serial_monitor import SerialMonitor
-from .component_panel import ComponentPanel
-from .toolbar import AppToolBar
-from ..models.project import Project
-from ..arduino.cli_manager import ArduinoCLI
+
+APP_TITLE = 'Arduino Simulation Platform'
+
+# Menu bar layout: (menu title, entries), where each entry is
+# (text, shortcut, slot method name) or None for a separator. Shortcuts
+# are standard keys or key sequence strings.
+MENU_SPEC = (
+    ('&File', (
+        ('&New Project', STANDARD_KEY.New, 'new_project'),
+        ('&Open Project...', STANDARD_KEY.Open, 'open_project'),
+        ('&Save Project', STANDARD_KEY.Save, 'save_project'),
+        ('Save Project &As...', STANDARD_KEY.SaveAs, 'save_project_as'),
+        None,
+        ('E&xit', STANDARD_KEY.Quit, 'close'),
+    )),
+    ('&Edit', (
+        ('&Undo', STANDARD_KEY.Undo, None),
+        ('&Redo', STANDARD_KEY.Redo, None),
+        None,
+        ('Cu&t', STANDARD_KEY.Cut, None),
+        ('&Copy', STANDARD_KEY.Copy, None),
+        ('&Paste', STANDARD_KEY.Paste, None),
+    )),
+    ('&Simulation', (
+        ('&Start Simulation', 'F5', 'start_simulation'),
+        ('S&top Simulation', 'Shift+F5', 'stop_simulation'),
+    )),
+    ('&Arduino', (
+        ('&Compile', 'F7', 'compile_code'),
+        ('&Upload', 'F9', 'upload_code'),
+        None,
+        ('Serial &Monitor', 'Ctrl+Shift+M', 'toggle_serial_monitor'),
+    )),
+    ('&Help', (
+        ('&Documentation', 'F1', None),
+        ('&Examples', None, None),
+        None,
+        ('&About', None, 'show_about'),
+    )),
+)
 
 
 class MainWindow(QMainWindow):
@@ -25,15 +58,37 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
+        # Child widgets, models and the CLI wrapper are imported where they
+        # are first built, so importing this module stays cheap
+        from ..models.project import Project
         self.project = Project()
-        self.arduino_cli = ArduinoCLI()
+        self._arduino_cli = None
         self.init_ui()
         self.setup_connections()
         self.update_title()
+        # The code editor and serial monitor are built once the event loop
+        # runs, so the window can paint before they exist
+        QTimer.singleShot(0, self._finish_init)
+        
+    @property
+    def arduino_cli(self):
+        """Arduino CLI wrapper, created on first use
+
+        Creating it probes for the arduino-cli binary, which startup
+        should not wait for.
+        """
+        if self._arduino_cli is None:
+            from ..arduino.cli_manager import ArduinoCLI
+            self._arduino_cli = ArduinoCLI()
+        return self._arduino_cli
         
     def init_ui(self):
         """Initialize user interface"""
-        self.setWindowTitle('Arduino Simulation Platform')
+        from .toolbar import AppToolBar
+        from .component_panel import ComponentPanel
+        from .canvas_view import CanvasView
+        
+        self.setWindowTitle(APP_TITLE)
         self.setGeometry(100, 100, 1400, 900)
         
         # Create menu bar
@@ -55,170 +110,68 @@ class MainWindow(QMainWindow):
         self.component_panel = ComponentPanel()
         
         # Center - Main workspace
-        center_splitter = QSplitter(Qt.Orientation.Vertical)
+        self.center_splitter = QSplitter(VERTICAL)
         
-        # Top - Circuit/Code tabs
+        # Top - Circuit/Code tabs; the Code tab holds a placeholder until
+        # _finish_init
         self.tab_widget = QTabWidget()
         self.canvas_view = CanvasView()
-        self.code_editor = CodeEditor()
         
         self.tab_widget.addTab(self.canvas_view, "Circuit Design")
-        self.tab_widget.addTab(self.code_editor, "Code")
-        
-        # Bottom - Serial monitor
-        self.serial_monitor = SerialMonitor()
+        self.tab_widget.addTab(QWidget(), "Code")
         
-        center_splitter.addWidget(self.tab_widget)
-        center_splitter.addWidget(self.serial_monitor)
-        center_splitter.setStretchFactor(0, 3)
-        center_splitter.setStretchFactor(1, 1)
+        # Bottom - Serial monitor, also a placeholder until _finish_init
+        self.center_splitter.addWidget(self.tab_widget)
+        self.center_splitter.addWidget(QWidget())
+        self.center_splitter.setStretchFactor(0, 3)
+        self.center_splitter.setStretchFactor(1, 1)
         
         # Add panels to main layout
         main_layout.addWidget(self.component_panel, 1)
-        main_layout.addWidget(center_splitter, 4)
+        main_layout.addWidget(self.center_splitter, 4)
         
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage('Ready')
         
-    def create_menu_bar(self):
-        """Create application menu bar"""
-        menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu('&File')
-        
-        new_action = QAction('&New Project', self)
-        try:
-            new_action.setShortcut(QKeySequence.StandardKey.New)
-        except:
-            new_action.setShortcut(QKeySequence.New)
-        new_action.triggered.connect(self.new_project)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction('&Open Project...', self)
-        try:
-            open_action.setShortcut(QKeySequence.StandardKey.Open)
-        except:
-            open_action.setShortcut(QKeySequence.Open)
-        open_action.triggered.connect(self.open_project)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction('&Save Project', self)
-        try:
-            save_action.setShortcut(QKeySequence.StandardKey.Save)
-        except:
-            save_action.setShortcut(QKeySequence.Save)
-        save_action.triggered.connect(self.save_project)
-        file_menu.addAction(save_action)
-        
-        save_as_action = QAction('Save Project &As...', self)
-        try:
-            save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
-        except:
-            save_as_action.setShortcut(QKeySequence.SaveAs)
-        save_as_action.triggered.connect(self.save_project_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction('E&xit', self)
-        try:
-            exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        except:
-            exit_action.setShortcut(QKeySequence.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menubar.addMenu('&Edit')
-        
-        undo_action = QAction('&Undo', self)
-        try:
-            undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        except:
-            undo_action.setShortcut(QKeySequence.Undo)
-        edit_menu.addAction(undo_action)
-        
-        redo_action = QAction('&Redo', self)
-        try:
-            redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        except:
-            redo_action.setShortcut(QKeySequence.Redo)
-        edit_menu.addAction(redo_action)
+    def _finish_init(self):
+        """Build the code editor and serial monitor in place of their placeholders"""
+        from .code_editor import CodeEditor
+        from .serial_monitor import SerialMonitor
         
-        edit_menu.addSeparator()
-        
-        cut_action = QAction('Cu&t', self)
-        try:
-            cut_action.setShortcut(QKeySequence.StandardKey.Cut)
-        except:
-            cut_action.setShortcut(QKeySequence.Cut)
-        edit_menu.addAction(cut_action)
-        
-        copy_action = QAction('&Copy', self)
-        try:
-            copy_action.setShortcut(QKeySequence.StandardKey.Copy)
-        except:
-            copy_action.setShortcut(QKeySequence.Copy)
-        edit_menu.addAction(copy_action)
-        
-        paste_action = QAction('&Paste', self)
-        try:
-            paste_action.setShortcut(QKeySequence.StandardKey.Paste)
-        except:
-            paste_action.setShortcut(QKeySequence.Paste)
-        edit_menu.addAction(paste_action)
-        
-        # Simulation menu
-        sim_menu = menubar.addMenu('&Simulation')
-        
-        start_sim_action = QAction('&Start Simulation', self)
-        start_sim_action.setShortcut('F5')
-        start_sim_action.triggered.connect(self.start_simulation)
-        sim_menu.addAction(start_sim_action)
-        
-        stop_sim_action = QAction('S&top Simulation', self)
-        stop_sim_action.setShortcut('Shift+F5')
-        stop_sim_action.triggered.connect(self.stop_simulation)
-        sim_menu.addAction(stop_sim_action)
-        
-        # Arduino menu
-        arduino_menu = menubar.addMenu('&Arduino')
-        
-        compile_action = QAction('&Compile', self)
-        compile_action.setShortcut('F7')
-        compile_action.triggered.connect(self.compile_code)
-        arduino_menu.addAction(compile_action)
-        
-        upload_action = QAction('&Upload', self)
-        upload_action.setShortcut('F9')
-        upload_action.triggered.connect(self.upload_code)
-        arduino_menu.addAction(upload_action)
-        
-        arduino_menu.addSeparator()
-        
-        serial_action = QAction('Serial &Monitor', self)
-        serial_action.setShortcut('Ctrl+Shift+M')
-        serial_action.triggered.connect(self.toggle_serial_monitor)
-        arduino_menu.addAction(serial_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu('&Help')
-        
-        docs_action = QAction('&Documentation', self)
-        docs_action.setShortcut('F1')
-        help_menu.addAction(docs_action)
-        
-        examples_action = QAction('&Examples', self)
-        help_menu.addAction(examples_action)
-        
-        help_menu.addSeparator()
+        self.code_editor = CodeEditor()
+        placeholder = self.tab_widget.widget(1)
+        self.tab_widget.removeTab(1)
+        self.tab_widget.insertTab(1, self.code_editor, "Code")
+        placeholder.deleteLater()
+        
+        # The stretch factor lives in the replaced widget's size policy, so
+        # set it again on the serial monitor. The placeholder had no size
+        # hint, so the first layout did not follow the stretch factors
+        # either; redo the 3:1 split.
+        self.serial_monitor = SerialMonitor()
+        self.center_splitter.replaceWidget(1, self.serial_monitor).deleteLater()
+        self.center_splitter.setStretchFactor(1, 1)
+        total = sum(self.center_splitter.sizes())
+        self.center_splitter.setSizes([total - total // 4, total // 4])
         
-        about_action = QAction('&About', self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+    def create_menu_bar(self):
+        """Create application menu bar from MENU_SPEC"""
+        menubar = self.menuBar()
+        for menu_title, entries in MENU_SPEC:
+            menu = menubar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot = entry
+                action = QAction(text, self)
+                if shortcut is not None:
+                    action.setShortcut(shortcut)
+                if slot is not None:
+                    action.triggered.connect(getattr(self, slot))
+                menu.addAction(action)
         
     def setup_connections(self):
         """Setup signal-slot connections"""
@@ -233,6 +186,7 @@ class MainWindow(QMainWindow):
         
     def new_project(self):
         """Create new project"""
+        from ..models.project import Project
         self.project = Project()
         self.canvas_view.clear()
         self.code_editor.clear()
@@ -309,13 +263,12 @@ class MainWindow(QMainWindow):
         )
         
     def update_title(self):
-        """Update window title"""
-        title = 'Arduino Simulation Platform'
-        if self.project.filename:
-            title += f' - {self.project.filename}'
-        if self.project.is_modified:
-            title += ' *'
-        self.setWindowTitle(title)
+        """Update window title, leaving it alone when nothing changed"""
+        filename = self.project.filename
+        mark = ' *' if self.project.is_modified else ''
+        title = f'{APP_TITLE} - {filename}{mark}' if filename else f'{APP_TITLE}{mark}'
+        if title != self.windowTitle():
+            self.setWindowTitle(title)
         
     def closeEvent(self, event):
         """Handle window close event"""
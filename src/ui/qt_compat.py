@@ -3,10 +3,10 @@ PyQt5/PyQt6 Compatibility Layer
 Automatically imports from PyQt5 or PyQt6 depending on what's available
 """
 
+import logging
+
 try:
-    from PyQt6.QtWidgets import *
-    from PyQt6.QtCore import *
-    from PyQt6.QtGui import *
+    from PyQt6 import QtCore, QtGui, QtWidgets
     PYQT_VERSION = 6
     
     # PyQt6 renames some enums
@@ -18,9 +18,7 @@ try:
         return app.exec()
         
 except ImportError:
-    from PyQt5.QtWidgets import *
-    from PyQt5.QtCore import *
-    from PyQt5.QtGui import *
+    from PyQt5 import QtCore, QtGui, QtWidgets
     PYQT_VERSION = 5
     
     from PyQt5.QtCore import Qt
@@ -30,4 +28,45 @@ except ImportError:
     def exec_app(app):
         return app.exec_()
 
-print(f"Using PyQt{PYQT_VERSION}")
+
+# Other Qt names are looked up on first use (PEP 562) instead of being
+# star-imported. Search order matches the old star imports, where later
+# modules won: QtGui, then QtCore, then QtWidgets. This also finds QAction
+# in QtGui on PyQt6 and in QtWidgets on PyQt5.
+_QT_MODULES = (QtGui, QtCore, QtWidgets)
+
+
+def __getattr__(name: str):
+    for module in _QT_MODULES:
+        value = getattr(module, name, None)
+        if value is not None:
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def qt_enum(group: str, name: str):
+    """Resolve a Qt enum member under its PyQt6 scoped name or PyQt5 flat name"""
+    try:
+        return getattr(getattr(Qt, group), name)
+    except AttributeError:
+        return getattr(Qt, name)
+
+
+# Enum members used across the UI, resolved once at import so call sites
+# need no per-call try/except or PyQt6-only spelling
+KEY_D = qt_enum('Key', 'Key_D')
+KEY_ESCAPE = qt_enum('Key', 'Key_Escape')
+KEY_DELETE = qt_enum('Key', 'Key_Delete')
+CONTROL_MODIFIER = qt_enum('KeyboardModifier', 'ControlModifier')
+NO_ITEM_FLAGS = qt_enum('ItemFlag', 'NoItemFlags')
+USER_ROLE = qt_enum('ItemDataRole', 'UserRole')
+VERTICAL = qt_enum('Orientation', 'Vertical')
+TEXT_BESIDE_ICON = qt_enum('ToolButtonStyle', 'ToolButtonTextBesideIcon')
+
+# QKeySequence.StandardKey on PyQt6; PyQt5 also exposes the members flat
+STANDARD_KEY = getattr(QtGui.QKeySequence, 'StandardKey', QtGui.QKeySequence)
+# Likewise QStyle.StandardPixmap
+STANDARD_PIXMAP = getattr(QtWidgets.QStyle, 'StandardPixmap', QtWidgets.QStyle)
+
+logging.getLogger(__name__).debug("Using PyQt%d", PYQT_VERSION)
@@ -3,16 +3,25 @@ Serial Monitor Widget
 """
 
 from .qt_compat import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
-    QLineEdit, QPushButton, QComboBox, QLabel
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
+    QLineEdit, QPushButton, QComboBox, QLabel, QTimer
 )
 
 
+BAUD_RATES = ("9600", "115200", "57600", "38400", "19200")
+
+# Lines kept in the output; older lines are dropped
+MAX_OUTPUT_LINES = 5000
+# Lines arriving within this window are appended together
+OUTPUT_FLUSH_MS = 30
+
+
 class SerialMonitor(QWidget):
     """Serial monitor for Arduino communication"""
     
     def __init__(self):
         super().__init__()
+        self._pending_output = []
         self.init_ui()
         
     def init_ui(self):
@@ -30,7 +39,7 @@ class SerialMonitor(QWidget):
         
         control_layout.addWidget(QLabel("Baud:"))
         self.baud_combo = QComboBox()
-        self.baud_combo.addItems(["9600", "115200", "57600", "38400", "19200"])
+        self.baud_combo.addItems(BAUD_RATES)
         control_layout.addWidget(self.baud_combo)
         
         self.connect_button = QPushButton("Connect")
@@ -45,8 +54,9 @@ class SerialMonitor(QWidget):
         layout.addLayout(control_layout)
         
         # Output area
-        self.output = QTextEdit()
+        self.output = QPlainTextEdit()
         self.output.setReadOnly(True)
+        self.output.setMaximumBlockCount(MAX_OUTPUT_LINES)
         self.output.setPlainText("Serial monitor ready...\n")
         layout.addWidget(self.output)
         
@@ -63,9 +73,21 @@ class SerialMonitor(QWidget):
         
     def clear_output(self):
         """Clear output text"""
+        self._pending_output.clear()
         self.output.clear()
-        self.output.setPlainText("Serial monitor cleared...\n")
+        self.output.appendPlainText("Serial monitor cleared...")
         
     def append_output(self, text: str):
-        """Append text to output"""
-        self.output.append(text)
+        """Append text to output
+
+        Bursts of serial lines are buffered briefly and appended as one
+        document edit.
+        """
+        if not self._pending_output:
+            QTimer.singleShot(OUTPUT_FLUSH_MS, self._flush_output)
+        self._pending_output.append(text)
+        
+    def _flush_output(self):
+        if self._pending_output:
+            self.output.appendPlainText("\n".join(self._pending_output))
+            self._pending_output.clear()
@@ -3,8 +3,23 @@ Application Toolbar
 """
 
 from .qt_compat import (
-    QToolBar, QAction, QComboBox, QLabel,
-    pyqtSignal
+    QToolBar, QAction, QComboBox, QLabel, QTimer,
+    pyqtSignal, STANDARD_PIXMAP, TEXT_BESIDE_ICON
+)
+
+
+BOARDS = ("Arduino Uno", "Arduino Nano", "Arduino Mega", "ESP32", "ESP8266")
+# board_changed is emitted once the selection has been still this long
+BOARD_CHANGE_DELAY_MS = 50
+
+# (attribute, text, tooltip, signal emitted when triggered, standard icon)
+SIMULATION_ACTIONS = (
+    ("start_action", "Start", "Start simulation (F5)", "simulation_started", "SP_MediaPlay"),
+    ("stop_action", "Stop", "Stop simulation (Shift+F5)", "simulation_stopped", "SP_MediaStop"),
+)
+BUILD_ACTIONS = (
+    ("compile_action", "Compile", "Compile code (F7)", "compile_requested", "SP_ComputerIcon"),
+    ("upload_action", "Upload", "Upload to board (F9)", "upload_requested", "SP_ArrowUp"),
 )
 
 
@@ -17,53 +32,88 @@ class AppToolBar(QToolBar):
     upload_requested = pyqtSignal()
     board_changed = pyqtSignal(str)
     
+    # Standard icon name -> QIcon, shared by all toolbars
+    _icons = {}
+    
     def __init__(self, parent=None):
         super().__init__("Main Toolbar", parent)
         self.setMovable(False)
-        self.init_ui()
+        self.setToolButtonStyle(TEXT_BESIDE_ICON)
+        # Last state applied by set_simulation_running
+        self._running = None
+        # Populate with updates off so the toolbar is laid out and painted
+        # once, not after every insertion
+        self.setUpdatesEnabled(False)
+        try:
+            self.init_ui()
+        finally:
+            self.setUpdatesEnabled(True)
         
     def init_ui(self):
         """Initialize UI"""
         # Simulation controls
-        self.start_action = QAction("▶ Start", self)
-        self.start_action.setToolTip("Start simulation (F5)")
-        self.start_action.triggered.connect(self.simulation_started.emit)
-        self.addAction(self.start_action)
-        
-        self.stop_action = QAction("⏹ Stop", self)
-        self.stop_action.setToolTip("Stop simulation (Shift+F5)")
-        self.stop_action.triggered.connect(self.simulation_stopped.emit)
-        self.addAction(self.stop_action)
+        self._add_actions(SIMULATION_ACTIONS)
         
         self.addSeparator()
         
         # Board selection
         self.addWidget(QLabel(" Board: "))
         self.board_combo = QComboBox()
-        self.board_combo.addItems([
-            "Arduino Uno",
-            "Arduino Nano", 
-            "Arduino Mega",
-            "ESP32",
-            "ESP8266"
-        ])
-        self.board_combo.currentTextChanged.connect(self.board_changed.emit)
+        self.board_combo.addItems(BOARDS)
+        # Stepping through boards with the arrow keys restarts the timer,
+        # so listeners only see the board the user settles on
+        self._board_timer = QTimer(self)
+        self._board_timer.setSingleShot(True)
+        self._board_timer.setInterval(BOARD_CHANGE_DELAY_MS)
+        self._board_timer.timeout.connect(self._emit_board_changed)
+        self.board_combo.currentTextChanged.connect(self._schedule_board_changed)
         self.addWidget(self.board_combo)
         
         self.addSeparator()
         
-        # Compile and upload
-        self.compile_action = QAction("⚙ Compile", self)
-        self.compile_action.setToolTip("Compile code (F7)")
-        self.compile_action.triggered.connect(self.compile_requested.emit)
-        self.addAction(self.compile_action)
+        # Compile and upload are added once the toolbar is first shown
+        self._build_actions_added = False
+        
+    def showEvent(self, event):
+        """Schedule the compile/upload actions on first show"""
+        super().showEvent(event)
+        if not self._build_actions_added:
+            QTimer.singleShot(0, self._add_build_actions)
+            
+    def _add_build_actions(self):
+        if self._build_actions_added:
+            return
+        self._build_actions_added = True
+        self._add_actions(BUILD_ACTIONS)
+        
+    def _add_actions(self, spec):
+        """Create, wire and add the actions described by spec"""
+        for attr, text, tooltip, signal, icon_name in spec:
+            action = QAction(self._icon(icon_name), text, self)
+            action.setToolTip(tooltip)
+            action.triggered.connect(getattr(self, signal).emit)
+            self.addAction(action)
+            setattr(self, attr, action)
+        
+    def _icon(self, name: str):
+        icon = AppToolBar._icons.get(name)
+        if icon is None:
+            icon = AppToolBar._icons[name] = self.style().standardIcon(
+                getattr(STANDARD_PIXMAP, name)
+            )
+        return icon
+        
+    def _schedule_board_changed(self, _board: str):
+        self._board_timer.start()
         
-        self.upload_action = QAction("⬆ Upload", self)
-        self.upload_action.setToolTip("Upload to board (F9)")
-        self.upload_action.triggered.connect(self.upload_requested.emit)
-        self.addAction(self.upload_action)
+    def _emit_board_changed(self):
+        self.board_changed.emit(self.board_combo.currentText())
         
     def set_simulation_running(self, running: bool):
         """Update toolbar state based on simulation status"""
+        running = bool(running)
+        if running == self._running:
+            return
+        self._running = running
         self.start_action.setEnabled(not running)
         self.stop_action.setEnabled(running)